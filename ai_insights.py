@@ -1,17 +1,61 @@
 import logging
 import random
+import threading
+from collections import Counter, OrderedDict
 from typing import Dict, List, Any
 
-# Set up logging
-logging.basicConfig(level=logging.DEBUG)
+# Numba is optional; without it large result sets use the pure-Python pass
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Logging is configured once by config.setup_logging() at application entry
 logger = logging.getLogger(__name__)
 
+# Number of distinct optimization results whose insights are kept
+INSIGHTS_CACHE_SIZE = 32
+_insights_cache = OrderedDict()
+_insights_cache_lock = threading.Lock()
+
+# Below this many assignments JIT dispatch and array building cost more than they save
+NUMBA_MIN_ASSIGNMENTS = 200
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _aggregate_assignment_arrays(costs, skills):
+        """Return (skill_sum, top1, top2, low1, low2) indices over parallel cost/skill arrays (-1 if absent)"""
+        skill_sum = 0.0
+        top1 = -1
+        top2 = -1
+        low1 = -1
+        low2 = -1
+        for k in range(costs.shape[0]):
+            skill = skills[k]
+            skill_sum += skill
+            if skill < 70:
+                if low1 == -1:
+                    low1 = k
+                elif low2 == -1:
+                    low2 = k
+            cost = costs[k]
+            if top1 == -1 or cost > costs[top1]:
+                top2 = top1
+                top1 = k
+            elif top2 == -1 or cost > costs[top2]:
+                top2 = k
+        return skill_sum, top1, top2, low1, low2
+
 def generate_insights(data: Dict[str, Any], optimization_result: Dict[str, Any]) -> Dict[str, Any]:
     """
     Generate AI-powered insights and explanations for the optimization results.
     
     This is the fallback implementation when OpenAI integration is not available.
-    Generates deterministic insights based on the optimization data.
+    Generates deterministic insights based on the optimization data. Results are
+    memoized on the contents of the inputs, so repeated requests for the same
+    optimization result skip recomputation.
     
     Args:
         data: Original input data
@@ -21,9 +65,61 @@ def generate_insights(data: Dict[str, Any], optimization_result: Dict[str, Any])
         Dictionary with insights and explanations
     """
     # Log that we're using the fallback implementation
-    import logging
-    logger = logging.getLogger(__name__)
     logger.info("Using deterministic fallback insights generation")
+    
+    try:
+        cache_key = _insights_cache_key(data, optimization_result)
+    except (KeyError, TypeError):
+        # Malformed or unhashable input; the uncached path reports the error
+        cache_key = None
+    
+    if cache_key is not None:
+        with _insights_cache_lock:
+            cached = _insights_cache.get(cache_key)
+            if cached is not None:
+                _insights_cache.move_to_end(cache_key)
+        if cached is not None:
+            logger.info("Reusing cached insights for identical optimization results")
+            return _copy_insights(cached)
+    
+    insights = _compute_insights(data, optimization_result)
+    
+    # Error results carry no metrics and are not cached
+    if cache_key is not None and insights['metrics']:
+        with _insights_cache_lock:
+            _insights_cache[cache_key] = insights
+            if len(_insights_cache) > INSIGHTS_CACHE_SIZE:
+                _insights_cache.popitem(last=False)
+        return _copy_insights(insights)
+    
+    return insights
+
+def _insights_cache_key(data: Dict[str, Any], optimization_result: Dict[str, Any]) -> tuple:
+    """Build a hashable key from every input field the insights depend on"""
+    key = (
+        data['budget'],
+        data['deadline'],
+        optimization_result['total_cost'],
+        optimization_result['budget_remaining'],
+        optimization_result['completion_time'],
+        optimization_result['time_buffer'],
+        tuple((r['severity'], r['message']) for r in optimization_result['risks']),
+        tuple((a['developer'], a['project'], a['cost'], a['skill_match'])
+              for a in optimization_result['assignments'])
+    )
+    hash(key)  # Raises TypeError for unhashable field values
+    return key
+
+def _copy_insights(insights: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy cached insights so callers cannot mutate the cache entry"""
+    return {
+        'explanation': insights['explanation'],
+        'recommendations': list(insights['recommendations']),
+        'metrics': dict(insights['metrics'])
+    }
+
+def _compute_insights(data: Dict[str, Any], optimization_result: Dict[str, Any]) -> Dict[str, Any]:
+    """Compute insights for the optimization results (uncached)"""
     try:
         logger.info("Generating AI insights for optimization results")
         
@@ -43,12 +139,26 @@ def generate_insights(data: Dict[str, Any], optimization_result: Dict[str, Any])
         # Time efficiency
         time_efficiency = (deadline - completion_time) / deadline * 100
         
-        # Risk count by severity
-        high_risks = sum(1 for r in risks if r['severity'] == 'high')
-        medium_risks = sum(1 for r in risks if r['severity'] == 'medium')
+        # Single pass over risks: severity counts and high-severity messages
+        high_risks = 0
+        medium_risks = 0
+        high_risk_messages = []
+        for r in risks:
+            severity = r['severity']
+            if severity == 'high':
+                high_risks += 1
+                high_risk_messages.append(r['message'])
+            elif severity == 'medium':
+                medium_risks += 1
+        
+        # Skill sum, low-skill developers and top-2 most expensive assignments
+        skill_sum, low_skill_devs, expensive_assignments = _summarize_assignments(assignments)
+        
+        # Projects per developer
+        dev_counts = Counter(a['developer'] for a in assignments)
         
         # Skill matching average
-        avg_skill_match = sum(a['skill_match'] for a in assignments) / len(assignments) if assignments else 0
+        avg_skill_match = skill_sum / len(assignments) if assignments else 0
         
         # Generate explanation based on the metrics
         explanation = _generate_explanation(
@@ -59,7 +169,8 @@ def generate_insights(data: Dict[str, Any], optimization_result: Dict[str, Any])
             avg_skill_match,
             total_cost,
             completion_time,
-            risks
+            high_risk_messages,
+            bool(risks)
         )
         
         # Generate recommendations
@@ -69,9 +180,9 @@ def generate_insights(data: Dict[str, Any], optimization_result: Dict[str, Any])
             high_risks,
             medium_risks,
             avg_skill_match,
-            risks,
-            assignments,
-            data
+            low_skill_devs,
+            expensive_assignments,
+            dev_counts
         )
         
         return {
@@ -92,58 +203,106 @@ def generate_insights(data: Dict[str, Any], optimization_result: Dict[str, Any])
             'metrics': {}
         }
 
+def _summarize_assignments(assignments: List[Dict[str, Any]]) -> tuple:
+    """
+    Aggregate assignments in a single pass
+    
+    Args:
+        assignments: List of assignment dictionaries
+    
+    Returns:
+        Tuple of (skill match sum, up to two low-skill developer names,
+        up to two most expensive assignments in descending cost order)
+    """
+    n = len(assignments)
+    if NUMBA_AVAILABLE and n >= NUMBA_MIN_ASSIGNMENTS:
+        costs = np.fromiter((a['cost'] for a in assignments), dtype=np.float64, count=n)
+        skills = np.fromiter((a['skill_match'] for a in assignments), dtype=np.float64, count=n)
+        skill_sum, top1, top2, low1, low2 = _aggregate_assignment_arrays(costs, skills)
+        low_skill_devs = [assignments[k]['developer'] for k in (low1, low2) if k != -1]
+        expensive_assignments = [assignments[k] for k in (top1, top2) if k != -1]
+        return float(skill_sum), low_skill_devs, expensive_assignments
+    
+    skill_sum = 0
+    low_skill_devs = []
+    top1 = None
+    top2 = None
+    for a in assignments:
+        skill_match = a['skill_match']
+        skill_sum += skill_match
+        if skill_match < 70 and len(low_skill_devs) < 2:
+            low_skill_devs.append(a['developer'])
+        cost = a['cost']
+        if top1 is None or cost > top1['cost']:
+            top2 = top1
+            top1 = a
+        elif top2 is None or cost > top2['cost']:
+            top2 = a
+    expensive_assignments = [a for a in (top1, top2) if a is not None]
+    return skill_sum, low_skill_devs, expensive_assignments
+
+# Explanation templates as (exclusive lower bound, template) tiers, checked in
+# order, with a fallback template when no bound is exceeded
+_BUDGET_TIERS = [
+    (30, "You have a comfortable budget buffer ({value:.1f}% remaining). "),
+    (10, "You have a reasonable budget buffer ({value:.1f}% remaining). "),
+]
+_BUDGET_FALLBACK = "Your budget is tight with only {value:.1f}% remaining. "
+
+_TIME_TIERS = [
+    (30, "The schedule has ample buffer ({value:.1f}% of deadline remaining). "),
+    (10, "The schedule has a reasonable buffer ({value:.1f}% of deadline remaining). "),
+    (0, "The schedule is tight with only {value:.1f}% buffer. "),
+]
+_TIME_FALLBACK = "The current plan exceeds your deadline by {overrun:.1f}% of the allocated time. "
+
+_SKILL_TIERS = [
+    (90, "Developer skill matching is excellent at {value:.1f}%. "),
+    (75, "Developer skill matching is good at {value:.1f}%. "),
+]
+_SKILL_FALLBACK = "Developer skill matching is suboptimal at {value:.1f}%. "
+
+def _tier_message(value: float, tiers: List[tuple], fallback: str) -> str:
+    """Format the template of the first tier whose bound value exceeds"""
+    for bound, template in tiers:
+        if value > bound:
+            return template.format(value=value)
+    return fallback.format(value=value, overrun=-value)
+
 def _generate_explanation(budget_efficiency: float, time_efficiency: float,
                          high_risks: int, medium_risks: int, avg_skill_match: float,
-                         total_cost: float, completion_time: float, risks: List[Dict[str, Any]]) -> str:
+                         total_cost: float, completion_time: float, high_risk_messages: List[str],
+                         has_risks: bool) -> str:
     """Generate a human-friendly explanation of the optimization results"""
     
     # Base explanation
-    explanation = f"This optimization will cost ${total_cost:.2f} and complete in {completion_time:.1f} days. "
-    
-    # Budget assessment
-    if budget_efficiency > 30:
-        explanation += f"You have a comfortable budget buffer ({budget_efficiency:.1f}% remaining). "
-    elif budget_efficiency > 10:
-        explanation += f"You have a reasonable budget buffer ({budget_efficiency:.1f}% remaining). "
-    else:
-        explanation += f"Your budget is tight with only {budget_efficiency:.1f}% remaining. "
-    
-    # Time assessment
-    if time_efficiency > 30:
-        explanation += f"The schedule has ample buffer ({time_efficiency:.1f}% of deadline remaining). "
-    elif time_efficiency > 10:
-        explanation += f"The schedule has a reasonable buffer ({time_efficiency:.1f}% of deadline remaining). "
-    elif time_efficiency > 0:
-        explanation += f"The schedule is tight with only {time_efficiency:.1f}% buffer. "
-    else:
-        explanation += f"The current plan exceeds your deadline by {-time_efficiency:.1f}% of the allocated time. "
+    parts = [f"This optimization will cost ${total_cost:.2f} and complete in {completion_time:.1f} days. "]
+    
+    # Budget and time assessment
+    parts.append(_tier_message(budget_efficiency, _BUDGET_TIERS, _BUDGET_FALLBACK))
+    parts.append(_tier_message(time_efficiency, _TIME_TIERS, _TIME_FALLBACK))
     
     # Risk assessment
     if high_risks > 0:
-        explanation += f"There are {high_risks} high-severity risks that require attention. "
+        parts.append(f"There are {high_risks} high-severity risks that require attention. ")
     if medium_risks > 0:
-        explanation += f"There are {medium_risks} medium-severity risks to consider. "
+        parts.append(f"There are {medium_risks} medium-severity risks to consider. ")
     if high_risks == 0 and medium_risks == 0:
-        explanation += "No significant risks were identified. "
+        parts.append("No significant risks were identified. ")
     
     # Skill match assessment
-    if avg_skill_match > 90:
-        explanation += f"Developer skill matching is excellent at {avg_skill_match:.1f}%. "
-    elif avg_skill_match > 75:
-        explanation += f"Developer skill matching is good at {avg_skill_match:.1f}%. "
-    else:
-        explanation += f"Developer skill matching is suboptimal at {avg_skill_match:.1f}%. "
+    parts.append(_tier_message(avg_skill_match, _SKILL_TIERS, _SKILL_FALLBACK))
     
-    # Add risk details if present
-    if risks:
-        explanation += "Key concerns: " + "; ".join(r['message'] for r in risks if r['severity'] == 'high')
+    # Add risk details if any risks were found; only high-severity messages are listed
+    if has_risks:
+        parts.append("Key concerns: " + "; ".join(high_risk_messages))
     
-    return explanation
+    return "".join(parts)
 
 def _generate_recommendations(budget_efficiency: float, time_efficiency: float,
                              high_risks: int, medium_risks: int, avg_skill_match: float,
-                             risks: List[Dict[str, Any]], assignments: List[Dict[str, Any]],
-                             original_data: Dict[str, Any]) -> List[str]:
+                             low_skill_devs: List[str], expensive_assignments: List[Dict[str, Any]],
+                             dev_counts: Dict[str, int]) -> List[str]:
     """Generate actionable recommendations based on the optimization results"""
     recommendations = []
     
@@ -160,28 +319,21 @@ def _generate_recommendations(budget_efficiency: float, time_efficiency: float,
         recommendations.append("Look for developers with more relevant skills to improve project quality.")
     
     # Look for low skill matches
-    low_skill_assignments = [a for a in assignments if a['skill_match'] < 70]
-    if low_skill_assignments:
-        dev_names = [a['developer'] for a in low_skill_assignments[:2]]
-        recommendations.append(f"Consider replacing or training {', '.join(dev_names)} to improve skill matching.")
+    if low_skill_devs:
+        recommendations.append(f"Consider replacing or training {', '.join(low_skill_devs)} to improve skill matching.")
     
     # High-cost assignments
-    expensive_assignments = sorted(assignments, key=lambda a: a['cost'], reverse=True)[:2]
     if expensive_assignments and any(a['cost'] > 1000 for a in expensive_assignments):
         project_names = [a['project'] for a in expensive_assignments]
         recommendations.append(f"Projects {', '.join(project_names)} have high costs. Consider alternative resourcing.")
     
     # Developer distribution
-    dev_counts = {}
-    for a in assignments:
-        dev_counts[a['developer']] = dev_counts.get(a['developer'], 0) + 1
-    
     overallocated_devs = [d for d, count in dev_counts.items() if count > 2]
     if overallocated_devs:
         recommendations.append(f"Developers {', '.join(overallocated_devs)} are assigned to too many projects, which may cause delays.")
     
     # Risk mitigations
-    if any(r['severity'] == 'high' for r in risks):
+    if high_risks > 0:
         recommendations.append("Address high severity risks immediately to prevent project failure.")
     
     return recommendations[:5]  # Limit to top 5 recommendations
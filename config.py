@@ -9,11 +9,37 @@ from logging.handlers import RotatingFileHandler
 DEBUG = os.environ.get('DEBUG', 'False').lower() == 'true'
 HOST = '0.0.0.0'
 PORT = int(os.environ.get('PORT', 5000))
+MAX_UPLOAD_SIZE = 16 * 1024 * 1024  # 16MB cap on request bodies such as file uploads
+MAX_JSON_BODY_SIZE = 1_000_000  # Bytes; larger JSON API bodies are rejected before parsing
 
 # API Keys and external services
 OPENAI_API_KEY = os.environ.get('OPENAI_API_KEY')
 IBM_QUANTUM_TOKEN = os.environ.get('IBM_QUANTUM_TOKEN')
 
+# Redis shares rate limiter state and async jobs across workers; without it
+# both are kept per process
+REDIS_URL = os.environ.get('REDIS_URL')
+
+# Rate limiting
+RATELIMIT_STORAGE_URI = REDIS_URL or 'memory://'
+RATELIMIT_STRATEGY = 'moving-window'
+# Per-route burst limits; they apply on top of the app-wide hourly and daily caps
+OPTIMIZE_RATE_LIMIT = "10 per second"
+RUN_CIRCUIT_RATE_LIMIT = "30 per second"
+# /optimize/batch entries, each batch costing its number of entries; must
+# allow at least MAX_BATCH_SIZE or full batches are always rejected
+BATCH_ENTRY_RATE_LIMIT = "200 per hour"
+
+# Batch optimization endpoint
+MAX_BATCH_SIZE = 100
+BATCH_REQUEST_TIMEOUT = 5  # seconds for a whole batch, from when it starts
+BATCH_MAX_WORKERS = min(8, (os.cpu_count() or 1) + 4)
+
+# Background optimization jobs (/optimize?async=true)
+JOB_MAX_WORKERS = 8
+JOB_RESULT_TTL = 600  # seconds a finished job's result stays available
+JOB_PENDING_TTL = 3600  # seconds an unfinished job stays known in Redis
+
 # Optimization settings
 DEFAULT_OPTIMIZATION_PARAMS = {
     'max_iterations': 1000,
@@ -7,88 +7,180 @@ import csv
 import io
 import traceback
 import logging
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Tuple, Union, BinaryIO
 import os
 
-def parse_uploaded_file(file_content: bytes, filename: str) -> Dict[str, Any]:
+try:
+    import pandas as pd
+    _HAS_PANDAS = True
+except ImportError:
+    _HAS_PANDAS = False
+
+# python-calamine parses workbooks in native code; fall back to pandas'
+# default engine (openpyxl/xlrd) when it is not installed
+try:
+    import python_calamine  # noqa: F401
+    _EXCEL_ENGINE = 'calamine'
+except ImportError:
+    _EXCEL_ENGINE = None
+
+logger = logging.getLogger(__name__)
+
+def parse_uploaded_file(file_content: Union[bytes, BinaryIO], filename: str) -> Dict[str, Any]:
     """
     Parse uploaded file (CSV or Excel) and extract project and developer data.
 
     Args:
-        file_content: Bytes of the uploaded file
+        file_content: Bytes or binary file-like object of the uploaded file;
+            a file-like object is read incrementally instead of in one piece
         filename: Name of the uploaded file
 
     Returns:
         Dictionary with extracted data
     """
     try:
+        if isinstance(file_content, (bytes, bytearray)):
+            file_content = io.BytesIO(file_content)
+
         # Determine file type from extension
         _, ext = os.path.splitext(filename)
         ext = ext.lower()
 
-        logging.info(f"Attempting to parse file: {filename} with extension {ext}")
+        logger.info(f"Attempting to parse file: {filename} with extension {ext}")
 
         if ext == '.csv':
             # Parse CSV file
-            logging.info("Parsing as CSV file")
+            logger.info("Parsing as CSV file")
             return _parse_csv(file_content)
         elif ext in ['.xlsx', '.xls']:
             # Parse Excel file
-            logging.info("Parsing as Excel file")
+            logger.info("Parsing as Excel file")
             return _parse_excel(file_content)
         else:
             # Unsupported file type
-            logging.error(f"Unsupported file type: {ext}")
+            logger.error(f"Unsupported file type: {ext}")
             return {
                 'success': False,
                 'error': f"Unsupported file type: {ext}"
             }
 
     except Exception as e:
-        logging.error(f"Error parsing uploaded file: {str(e)}")
-        import traceback
-        logging.error(f"Traceback: {traceback.format_exc()}")
+        logger.error(f"Error parsing uploaded file: {str(e)}")
+        logger.error(f"Traceback: {traceback.format_exc()}")
         return {
             'success': False,
             'error': f"Error parsing file: {str(e)}"
         }
 
-def _parse_csv(file_content: bytes) -> Dict[str, Any]:
+def _parse_csv(file_content: BinaryIO) -> Dict[str, Any]:
     """
     Parse CSV file content and extract data.
 
+    Rows are streamed in a single pass. Metadata rows are read until the first
+    section marker; a 'Developers' or 'Projects' marker switches the parser to
+    that section, whose next row is the header and whose data rows run until
+    a blank row. Reading stops once both sections have been read.
+
     Args:
-        file_content: Bytes of the uploaded CSV file
+        file_content: Binary file-like object of the uploaded CSV file
 
     Returns:
         Dictionary with extracted data
     """
-    content_str = file_content.decode('utf-8')
-    csv_reader = csv.reader(io.StringIO(content_str))
-
-    # Process the CSV content
-    all_rows = list(csv_reader)
+    # Decode incrementally through a buffered text layer instead of holding
+    # the whole decoded file in memory
+    text_stream = io.TextIOWrapper(file_content, encoding='utf-8', newline='')
+    csv_reader = csv.reader(text_stream)
 
     try:
-        # Extract metadata from the first rows
-        budget, deadline = _extract_metadata(all_rows)
-
-        # Find the developers and projects sections
-        dev_start_idx, proj_start_idx = _find_section_indices(all_rows)
-
-        if dev_start_idx == -1 or proj_start_idx == -1:
+        budget = 0.0
+        deadline = 0.0
+        developers = []
+        projects = []
+        dev_section_found = False
+        proj_section_found = False
+
+        # One of: meta, dev_header, dev, proj_header, proj, idle
+        mode = 'meta'
+        handlers = []
+
+        for i, row in enumerate(csv_reader):
+            # The row right after a section marker is that section's header
+            if mode == 'dev_header':
+                handlers = [_DEVELOPER_FIELDS.get(h.lower()) for h in row]
+                mode = 'dev'
+                continue
+            if mode == 'proj_header':
+                handlers = [_PROJECT_FIELDS.get(h.lower()) for h in row]
+                mode = 'proj'
+                continue
+
+            # Lowercase the first cell once; it serves both the section
+            # marker test and the metadata key lookup
+            lowered = row[0].lower() if row else ''
+            marker = lowered.strip()
+            if marker == 'developers':
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Found Developers section at row %d", i)
+                dev_section_found = True
+                developers = []
+                mode = 'dev_header'
+                continue
+            if marker == 'projects':
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Found Projects section at row %d", i)
+                proj_section_found = True
+                projects = []
+                mode = 'proj_header'
+                continue
+
+            if mode == 'meta':
+                if len(row) >= 2:
+                    if lowered == 'budget':
+                        try:
+                            budget = float(row[1])
+                            if logger.isEnabledFor(logging.INFO):
+                                logger.info("Found budget: %s", budget)
+                        except ValueError:
+                            logger.warning("Invalid budget value in CSV: %s", row[1])
+                    elif lowered == 'deadline':
+                        try:
+                            deadline = float(row[1])
+                            if logger.isEnabledFor(logging.INFO):
+                                logger.info("Found deadline: %s", deadline)
+                        except ValueError:
+                            logger.warning("Invalid deadline value in CSV: %s", row[1])
+                    # Both fields found; stop checking rows for metadata
+                    if budget and deadline:
+                        mode = 'idle'
+            elif mode == 'dev':
+                if not row or not row[0]:
+                    if dev_section_found and proj_section_found:
+                        break  # Both sections read; skip the rest of the file
+                    mode = 'idle'
+                    continue
+                developer = _extract_record(row, handlers, 'developer')
+                if 'name' in developer and developer['name']:
+                    developers.append(developer)
+            elif mode == 'proj':
+                if not row or not row[0]:
+                    if dev_section_found and proj_section_found:
+                        break  # Both sections read; skip the rest of the file
+                    mode = 'idle'
+                    continue
+                project = _extract_record(row, handlers, 'project')
+                if 'name' in project and project['name']:
+                    projects.append(project)
+
+        if not dev_section_found or not proj_section_found:
             return {
                 "success": False,
                 "error": "Could not find 'Developers' or 'Projects' sections in the CSV file."
             }
 
-        # Extract developers data
-        developers = _extract_developers(all_rows, dev_start_idx)
         if not developers:
             return {"success": False, "error": "No developers found in CSV file."}
 
-        # Extract projects data
-        projects = _extract_projects(all_rows, proj_start_idx)
         if not projects:
             return {"success": False, "error": "No projects found in CSV file."}
 
@@ -101,78 +193,71 @@ def _parse_csv(file_content: bytes) -> Dict[str, Any]:
         }
 
     except Exception as e:
-        logging.exception(f"CSV parsing error: {str(e)}") #Improved logging
+        logger.exception(f"CSV parsing error: {str(e)}") #Improved logging
         return {
             "success": False,
             "error": f"CSV parsing error: {str(e)}"
         }
 
-def _parse_excel(file_content: bytes) -> Dict[str, Any]:
+    finally:
+        # Leave the caller's stream open
+        text_stream.detach()
+
+# Known Excel sheet layouts, so pandas can skip unused columns and dtype inference
+_DEVELOPER_COLUMNS = ['Name', 'Rate', 'Hours per day', 'Skills']
+_DEVELOPER_DTYPES = {'Rate': 'float64', 'Hours per day': 'float64'}
+_PROJECT_COLUMNS = {'Name', 'Hours', 'Priority', 'Dependencies', 'Required Skills'}
+_PROJECT_DTYPES = {'Hours': 'float64', 'Priority': 'int64'}
+
+def _parse_excel(file_content: BinaryIO) -> Dict[str, Any]:
     """
     Parse Excel file content and extract data.
 
     Args:
-        file_content: Bytes of the uploaded Excel file
+        file_content: Seekable binary file-like object of the uploaded Excel file
 
     Returns:
         Dictionary with extracted data
     """
-    try:
-        import pandas as pd
+    if not _HAS_PANDAS:
+        return {
+            "success": False,
+            "error": "Pandas library is required for Excel parsing but was not found."
+        }
 
-        # Read Excel file
-        excel_file = io.BytesIO(file_content)
+    try:
+        # Open the workbook once and parse each sheet from it
+        excel_file = pd.ExcelFile(file_content, engine=_EXCEL_ENGINE)
 
         # Try to read metadata sheet first
-        metadata_df = pd.read_excel(excel_file, sheet_name='Metadata', header=None)
-        budget = float(metadata_df.iloc[0, 1])
-        deadline = float(metadata_df.iloc[1, 1])
-
-        # Reset file pointer
-        excel_file.seek(0)
+        budget, deadline = _read_excel_metadata(excel_file)
 
         # Read developers sheet
-        dev_df = pd.read_excel(excel_file, sheet_name='Developers')
-        developers = []
-
-        for _, row in dev_df.iterrows():
-            skills = row['Skills'].split(',') if isinstance(row['Skills'], str) else []
-            skills = [skill.strip() for skill in skills]
-
-            developer = {
-                "name": row['Name'],
-                "rate": float(row['Rate']),
-                "hours_per_day": float(row['Hours per day']),
-                "skills": skills
-            }
-            developers.append(developer)
-
-        # Reset file pointer
-        excel_file.seek(0)
+        dev_df = excel_file.parse(
+            'Developers',
+            usecols=_DEVELOPER_COLUMNS,
+            dtype=_DEVELOPER_DTYPES
+        )
+        developers = pd.DataFrame({
+            "name": dev_df['Name'],
+            "rate": dev_df['Rate'],
+            "hours_per_day": dev_df['Hours per day'],
+            "skills": _split_list_column(dev_df, 'Skills')
+        }).to_dict('records')
 
         # Read projects sheet
-        proj_df = pd.read_excel(excel_file, sheet_name='Projects')
-        projects = []
-
-        for _, row in proj_df.iterrows():
-            dependencies = []
-            if 'Dependencies' in proj_df.columns and pd.notna(row['Dependencies']):
-                deps = str(row['Dependencies']).split(',')
-                dependencies = [dep.strip() for dep in deps if dep.strip()]
-
-            required_skills = []
-            if 'Required Skills' in proj_df.columns and pd.notna(row['Required Skills']):
-                skills = str(row['Required Skills']).split(',')
-                required_skills = [skill.strip() for skill in skills if skill.strip()]
-
-            project = {
-                "name": row['Name'],
-                "hours": float(row['Hours']),
-                "priority": int(row['Priority']),
-                "dependencies": dependencies,
-                "required_skills": required_skills
-            }
-            projects.append(project)
+        proj_df = excel_file.parse(
+            'Projects',
+            usecols=lambda column: column in _PROJECT_COLUMNS,
+            dtype=_PROJECT_DTYPES
+        )
+        projects = pd.DataFrame({
+            "name": proj_df['Name'],
+            "hours": proj_df['Hours'],
+            "priority": proj_df['Priority'],
+            "dependencies": _split_list_column(proj_df, 'Dependencies'),
+            "required_skills": _split_list_column(proj_df, 'Required Skills')
+        }).to_dict('records')
 
         if not developers or not projects:
             return {"success": False, "error": "Excel file does not contain valid developer or project data"}
@@ -185,159 +270,117 @@ def _parse_excel(file_content: bytes) -> Dict[str, Any]:
             "projects": projects
         }
 
-    except ImportError:
-        return {
-            "success": False,
-            "error": "Pandas library is required for Excel parsing but was not found."
-        }
     except Exception as e:
-        logging.exception(f"Excel parsing error: {str(e)}") #Improved logging
+        logger.exception(f"Excel parsing error: {str(e)}") #Improved logging
         return {
             "success": False,
             "error": f"Excel parsing error: {str(e)}"
         }
 
-def _extract_metadata(rows: List[List[str]]) -> Tuple[float, float]:
+def _read_excel_metadata(excel_file) -> Tuple[float, float]:
     """
-    Extract budget and deadline from CSV rows.
+    Read budget and deadline from the Metadata sheet.
 
-    Args:
-        rows: List of CSV rows
-
-    Returns:
-        Tuple of (budget, deadline)
-    """
-    budget = 0.0
-    deadline = 0.0
-
-    for row in rows[:10]:  # Check first 10 rows for metadata
-        if len(row) >= 2:
-            if row[0].lower() == 'budget':
-                try:
-                    budget = float(row[1])
-                    logging.info(f"Found budget: {budget}")
-                except ValueError:
-                    logging.warning(f"Invalid budget value in CSV: {row[1]}")
-            elif row[0].lower() == 'deadline':
-                try:
-                    deadline = float(row[1])
-                    logging.info(f"Found deadline: {deadline}")
-                except ValueError:
-                    logging.warning(f"Invalid deadline value in CSV: {row[1]}")
-
-    return budget, deadline
-
-def _find_section_indices(rows: List[List[str]]) -> Tuple[int, int]:
-    """
-    Find indices of 'Developers' and 'Projects' sections in CSV.
+    With the calamine or openpyxl engine the two value cells are read straight
+    from the workbook, skipping DataFrame construction for a 2x2 sheet.
 
     Args:
-        rows: List of CSV rows
+        excel_file: Open pandas ExcelFile
 
     Returns:
-        Tuple of (developers_start_index, projects_start_index)
+        Tuple of (budget, deadline)
     """
-    dev_start_idx = -1
-    proj_start_idx = -1
-
-    for i, row in enumerate(rows):
-        if len(row) > 0:
-            # Strip whitespace and check for exact match
-            if row[0].strip().lower() == 'developers':
-                dev_start_idx = i
-                logging.info(f"Found Developers section at row {i}")
-            elif row[0].strip().lower() == 'projects':
-                proj_start_idx = i
-                logging.info(f"Found Projects section at row {i}")
-
-    return dev_start_idx, proj_start_idx
-
-def _extract_developers(rows: List[List[str]], start_idx: int) -> List[Dict[str, Any]]:
+    if excel_file.engine == 'calamine':
+        # Same read as pandas' calamine reader: rows from A1, limited to two
+        rows = excel_file.book.get_sheet_by_name('Metadata').to_python(skip_empty_area=False, nrows=2)
+        (_, budget), (_, deadline) = (row[:2] for row in rows)
+        return float(budget), float(deadline)
+    if excel_file.engine == 'openpyxl':
+        rows = excel_file.book['Metadata'].iter_rows(min_row=1, max_row=2, max_col=2, values_only=True)
+        (_, budget), (_, deadline) = rows
+        return float(budget), float(deadline)
+
+    metadata_df = excel_file.parse('Metadata', header=None, usecols=[0, 1], nrows=2)
+    return float(metadata_df.iloc[0, 1]), float(metadata_df.iloc[1, 1])
+
+def _split_list_column(df, column: str):
     """
-    Extract developers data from CSV rows.
+    Split a comma-separated Excel column into lists of stripped, non-empty items.
 
     Args:
-        rows: List of CSV rows
-        start_idx: Starting index of developers section
+        df: DataFrame read from an Excel sheet
+        column: Name of the column to split
 
     Returns:
-        List of developer dictionaries
+        Series of lists aligned with df (empty lists if the column is missing)
     """
-    developers = []
-    if start_idx == -1:
-        return developers #Return empty list if section not found
-
-    headers = [h.lower() for h in rows[start_idx + 1]]
-
-    for row in rows[start_idx + 2:]:
-        if not row or not row[0] or row[0].lower() == 'projects':
-            break
-
-        developer = {}
-        for i, cell in enumerate(row):
-            if i < len(headers):
-                header = headers[i]
-
-                try:
-                    if header == 'name':
-                        developer['name'] = cell
-                    elif header == 'rate':
-                        developer['rate'] = float(cell) if cell else 0.0
-                    elif header == 'hours per day' or header == 'hours_per_day':
-                        developer['hours_per_day'] = float(cell) if cell else 0.0
-                    elif header == 'skills':
-                        skills = [s.strip() for s in cell.split(',') if s.strip()]
-                        developer['skills'] = skills
-                except ValueError as e:
-                    logging.warning(f"Error processing developer data: {e}")
-
-        if 'name' in developer and developer['name']:
-            developers.append(developer)
-
-    return developers
-
-def _extract_projects(rows: List[List[str]], start_idx: int) -> List[Dict[str, Any]]:
+    if column not in df.columns:
+        return [[] for _ in range(len(df))]
+    # Split on commas together with their surrounding whitespace in one vectorized
+    # pass; only dropping empty items is left to Python
+    items = df[column].fillna('').astype(str).str.strip().str.split(r'\s*,\s*', regex=True)
+    return items.map(lambda parts: [part for part in parts if part])
+
+def _float_or_zero(cell: str) -> float:
+    return float(cell) if cell and not cell.isspace() else 0.0
+
+def _int_or_one(cell: str) -> int:
+    return int(cell) if cell and not cell.isspace() else 1
+
+def _split_cell(cell: str) -> List[str]:
+    return [item.strip() for item in cell.split(',') if item.strip()]
+
+# Lowercased CSV header -> (output key, cell converter)
+_DEVELOPER_FIELDS = {
+    'name': ('name', str),
+    'rate': ('rate', _float_or_zero),
+    'hours per day': ('hours_per_day', _float_or_zero),
+    'hours_per_day': ('hours_per_day', _float_or_zero),
+    'skills': ('skills', _split_cell),
+}
+
+_PROJECT_FIELDS = {
+    'name': ('name', str),
+    'hours': ('hours', _float_or_zero),
+    'priority': ('priority', _int_or_one),
+    'dependencies': ('dependencies', _split_cell),
+    'required skills': ('required_skills', _split_cell),
+    'required_skills': ('required_skills', _split_cell),
+}
+
+def _extract_record(row: List[str], handlers: List[Any], record_type: str) -> Dict[str, Any]:
     """
-    Extract projects data from CSV rows.
+    Extract a single developer or project from a CSV row.
 
     Args:
-        rows: List of CSV rows
-        start_idx: Starting index of projects section
+        row: CSV row from a developers or projects section
+        handlers: Per-column (key, converter) pairs resolved from the section
+            header, or None for columns that are ignored
+        record_type: 'developer' or 'project', used in warnings
 
     Returns:
-        List of project dictionaries
+        Developer or project dictionary
     """
-    projects = []
-    if start_idx == -1:
-        return projects #Return empty list if section not found
-
-    headers = [h.lower() for h in rows[start_idx + 1]]
-
-    for row in rows[start_idx + 2:]:
-        if not row or not row[0]:
-            break
-
-        project = {}
-        for i, cell in enumerate(row):
-            if i < len(headers):
-                header = headers[i]
-                try:
-                    if header == 'name':
-                        project['name'] = cell
-                    elif header == 'hours':
-                        project['hours'] = float(cell) if cell else 0.0
-                    elif header == 'priority':
-                        project['priority'] = int(cell) if cell else 1
-                    elif header == 'dependencies':
-                        deps = [d.strip() for d in cell.split(',') if d.strip()]
-                        project['dependencies'] = deps
-                    elif header == 'required skills' or header == 'required_skills':
-                        skills = [s.strip() for s in cell.split(',') if s.strip()]
-                        project['required_skills'] = skills
-                except ValueError as e:
-                    logging.warning(f"Error processing project data: {e}")
-
-        if 'name' in project and project['name']:
-            projects.append(project)
-
-    return projects
\ No newline at end of file
+    # Happy path: convert the whole row under a single try block
+    record = {}
+    try:
+        for handler, cell in zip(handlers, row):
+            if handler is not None:
+                record[handler[0]] = handler[1](cell)
+        return record
+    except ValueError:
+        pass
+
+    # A cell failed to convert; redo the row cell by cell so the remaining
+    # fields are still kept and each bad cell is reported
+    record = {}
+    for handler, cell in zip(handlers, row):
+        if handler is None:
+            continue
+        key, convert = handler
+        try:
+            record[key] = convert(cell)
+        except ValueError as e:
+            logger.warning("Error processing %s data: %s", record_type, e)
+
+    return record
@@ -0,0 +1,26 @@
+"""
+Gunicorn settings for serving the application: gunicorn main:app
+"""
+import importlib.util
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+
+# Rate limits and /optimize?async=true jobs are only shared between workers
+# through Redis, so several processes are started only when REDIS_URL is set
+# and redis-py is installed.
+# Otherwise a single worker serves with more threads; NumPy releases the GIL
+# in the optimization hot paths, and threads waiting on OpenAI or IBM Quantum
+# don't hold the worker
+worker_class = 'gthread'
+if os.environ.get('REDIS_URL') and importlib.util.find_spec('redis') is not None:
+    # One process per core for CPU-bound optimization
+    workers = max(2, os.cpu_count() or 1)
+    threads = 4
+else:
+    workers = 1
+    threads = 4 * max(2, os.cpu_count() or 1)
+
+# Import the app once in the master so NumPy, compiled Numba kernels and
+# module-level state are shared with the forked workers copy-on-write
+preload_app = True
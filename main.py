@@ -1,10 +1,32 @@
 import json
 import os
 import logging
-from flask import Flask, request, render_template, jsonify
+import threading
+import time
+import uuid
+import concurrent.futures
+from flask import Flask, request, render_template, jsonify, g
 from flask_cors import CORS
+from werkzeug.exceptions import BadRequest, HTTPException, RequestEntityTooLarge
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
+from flask.json.provider import DefaultJSONProvider
+
+# orjson serializes responses in native code and handles NumPy arrays; fall
+# back to Flask's stdlib-based provider when it is not installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# redis-py keeps async jobs in Redis when REDIS_URL is set, so any worker can
+# answer a poll; without it jobs stay in the process that queued them
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
 
 import optimizer
 import ai_insights
@@ -18,19 +40,43 @@ import config
 config.setup_logging()
 logger = logging.getLogger(__name__)
 
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that serializes jsonify() responses with orjson"""
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS if ORJSON_AVAILABLE else 0
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self.option).decode()
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=self.option),
+            mimetype=self.mimetype
+        )
+
 # Initialize Flask app
 app = Flask(__name__)
+if ORJSON_AVAILABLE:
+    app.json = OrjsonProvider(app)
 app.secret_key = os.environ.get("SESSION_SECRET", "qeo-development-key")
+app.config['MAX_CONTENT_LENGTH'] = config.MAX_UPLOAD_SIZE
 
 # Enable CORS for security
 CORS(app, resources={r"/*": {"origins": "*"}})
 
-# Set up rate limiting
+# Set up rate limiting; the Redis storage needs redis-py, so without it limits
+# are kept per process even when REDIS_URL is set
+ratelimit_storage_uri = config.RATELIMIT_STORAGE_URI
+if config.REDIS_URL and not REDIS_AVAILABLE:
+    logger.warning("REDIS_URL is set but redis is not installed - rate limits and async jobs are kept per process")
+    ratelimit_storage_uri = 'memory://'
+
 limiter = Limiter(
     get_remote_address,
     app=app,
     default_limits=["200 per day", "50 per hour"],
-    storage_uri="memory://"
+    storage_uri=ratelimit_storage_uri,
+    strategy=config.RATELIMIT_STRATEGY
 )
 
 # Initialize quantum optimizer and OpenAI insights generator
@@ -69,6 +115,20 @@ quantum_opt = quantum_optimizer.QuantumWorkflowOptimizer(use_quantum=use_quantum
 openai_gen = openai_insights.OpenAIInsightsGenerator(api_key=openai_key)
 quantum_playground_instance = quantum_playground.QuantumPlayground(use_real_quantum=use_quantum, ibm_token=ibm_token)
 
+# Shared worker pool for classical runs in /optimize/batch; NumPy releases the GIL
+_batch_executor = concurrent.futures.ThreadPoolExecutor(max_workers=config.BATCH_MAX_WORKERS)
+
+# Background jobs queued by /optimize?async=true. They run in the process that
+# queued them; their state is kept in Redis when REDIS_URL is set and otherwise
+# in _jobs: job id -> (future, submit time)
+_job_executor = concurrent.futures.ThreadPoolExecutor(max_workers=config.JOB_MAX_WORKERS)
+_jobs = {}
+_jobs_lock = threading.Lock()
+_JOB_KEY_PREFIX = 'qeo:job:'
+_job_redis = None
+if config.REDIS_URL and REDIS_AVAILABLE:
+    _job_redis = redis.Redis.from_url(config.REDIS_URL)
+
 @app.route('/')
 def index():
     """Render the main application page"""
@@ -92,152 +152,411 @@ def import_file():
             return jsonify({'success': False, 'error': 'No file selected'}), 400
             
         if file:
-            # Read the file content
-            file_content = file.read()
-            
-            # Parse the file based on its type
-            result = file_parser.parse_uploaded_file(file_content, file.filename)
+            # Parse the upload straight from its stream rather than reading it into memory first
+            result = file_parser.parse_uploaded_file(file.stream, file.filename)
             
             if not result.get('success', False):
-                logger.error(f"File parsing error: {result.get('error', 'Unknown error')}")
+                logger.error("File parsing error: %s", result.get('error', 'Unknown error'))
                 return jsonify(result), 400
                 
-            logger.info(f"Successfully imported data from file: {file.filename}")
+            logger.info("Successfully imported data from file: %s", file.filename)
             return jsonify(result)
             
+    except RequestEntityTooLarge:
+        limit_mb = config.MAX_UPLOAD_SIZE // (1024 * 1024)
+        return jsonify({'success': False, 'error': f'File exceeds the {limit_mb} MB upload limit'}), 413
     except Exception as e:
-        logger.error(f"Error processing file upload: {str(e)}")
+        logger.error("Error processing file upload: %s", e)
         return jsonify({'success': False, 'error': f'File upload failed: {str(e)}'}), 500
 
+def _get_json_body():
+    """
+    Parse the request body as JSON without caching its raw bytes on the request.
+
+    Oversized bodies are rejected before parsing. orjson is used when
+    available; the parsed payload is passed on as-is to validation and
+    optimization. The body is parsed once per request: the payload (or the
+    parse error) is kept on flask.g, so a rate limit cost function can read
+    it before the view does.
+
+    Returns:
+        Parsed JSON payload
+
+    Raises:
+        RequestEntityTooLarge: If the body exceeds MAX_JSON_BODY_SIZE
+        BadRequest: If the body is not valid JSON
+    """
+    if 'json_body_error' in g:
+        raise g.json_body_error
+    if 'json_body' not in g:
+        try:
+            g.json_body = _parse_json_body()
+        except HTTPException as e:
+            g.json_body_error = e
+            raise
+    return g.json_body
+
+def _parse_json_body():
+    """Parse the request body for _get_json_body"""
+    if request.content_length is not None and request.content_length > config.MAX_JSON_BODY_SIZE:
+        raise RequestEntityTooLarge(f'Request body exceeds {config.MAX_JSON_BODY_SIZE} bytes')
+    
+    if not ORJSON_AVAILABLE:
+        return request.get_json(force=True, cache=False)
+    
+    try:
+        return orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError as e:
+        raise BadRequest(f'Invalid JSON body: {str(e)}')
+
+def _batch_cost():
+    """Rate limit cost of an /optimize/batch call: its number of entries, at least 1"""
+    try:
+        data = _get_json_body()
+    except HTTPException:
+        return 1  # The view reports the error
+    batch = data.get('requests') if isinstance(data, dict) else None
+    return max(1, len(batch)) if isinstance(batch, list) else 1
+
 @app.route('/optimize', methods=['POST'])
+@limiter.limit(config.OPTIMIZE_RATE_LIMIT, override_defaults=False)
 def optimize():
     """Process optimization request and return results"""
     try:
         # Get input data from request
-        data = request.json
-        logger.info(f"Received optimization request with {len(data.get('developers', []))} developers and {len(data.get('projects', []))} projects")
-        
-        # Validate input data
-        if not _validate_input(data):
-            logger.error("Input validation failed")
-            return jsonify({'success': False, 'error': 'Invalid input data'}), 400
+        data = _get_json_body()
+        logger.info("Received optimization request with %d developers and %d projects", len(data.get('developers', [])), len(data.get('projects', [])))
         
         # Check if we should try quantum optimization
         use_quantum_param = request.args.get('quantum', 'true').lower() == 'true'
         
-        try:
-            if use_quantum and use_quantum_param:
-                # Run quantum-powered optimization algorithm
-                logger.info("Using quantum-powered optimization")
-                optimization_result = quantum_opt.optimize(
-                    data['budget'],
-                    data['deadline'],
-                    data['developers'],
-                    data['projects']
-                )
-            else:
-                # Run classical optimization algorithm
-                logger.info("Using classical optimization")
-                optimization_result = optimizer.run_optimization(
-                    data['budget'],
-                    data['deadline'],
-                    data['developers'],
-                    data['projects']
-                )
-                
-            logger.info(f"Optimization completed successfully with {len(optimization_result.get('assignments', []))} assignments")
-        except Exception as opt_error:
-            logger.error(f"Optimization algorithm failed: {str(opt_error)}")
-            return jsonify({'success': False, 'error': f'Optimization algorithm failed: {str(opt_error)}'}), 500
+        run_quantum = use_quantum and use_quantum_param
         
-        try:
-            # Generate AI insights - try OpenAI first, fall back to deterministic
-            if use_openai:
-                logger.info("Generating OpenAI-powered insights")
-                insights = openai_gen.generate_insights(
-                    data, 
-                    optimization_result
-                )
-            else:
-                logger.info("Using deterministic insights")
-                insights = ai_insights.generate_insights(
-                    data, 
-                    optimization_result
-                )
+        # ?async=true queues the job and returns a job id to poll at /optimize/result/<job_id>
+        if request.args.get('async', 'false').lower() == 'true':
+            job_id = _submit_job(data, run_quantum, _wants_insights())
+            logger.info("Queued optimization job %s", job_id)
+            return jsonify({'success': True, 'job_id': job_id, 'status': 'pending'}), 202
+        
+        result, status = _process_optimization(data, run_quantum, _wants_insights())
+        return jsonify(result), status
+    
+    except HTTPException as e:
+        return jsonify({'success': False, 'error': e.description}), e.code
+    except Exception as e:
+        logger.error("Error in optimization process: %s", e)
+        return jsonify({'success': False, 'error': f'Optimization failed: {str(e)}'}), 500
+
+@app.route('/optimize/result/<job_id>', methods=['GET'])
+def optimize_result(job_id):
+    """Return the result of a queued optimization job, or its pending status"""
+    job = _load_job(job_id)
+    
+    if job is None:
+        return jsonify({'success': False, 'error': 'Unknown or expired job id'}), 404
+    if job['status'] == 'pending':
+        return jsonify({'success': True, 'job_id': job_id, 'status': 'pending'}), 202
+    if job['status'] == 'failed':
+        return jsonify({'success': False, 'error': job['error']}), 500
+    return jsonify(job['result']), job['code']
+
+def _submit_job(data, run_quantum, want_insights=True):
+    """
+    Queue an optimization request on the job pool.
+
+    Args:
+        data: Request body with budget, deadline, developers and projects
+        run_quantum: Whether to use the quantum-powered optimizer
+        want_insights: Whether to generate insights for the result
+
+    Returns:
+        Job id to poll at /optimize/result/<job_id>
+    """
+    job_id = uuid.uuid4().hex
+    if _job_redis is not None:
+        # Mark the job pending before it can finish and store its result
+        _job_redis.set(_JOB_KEY_PREFIX + job_id, app.json.dumps({'status': 'pending'}),
+                       ex=config.JOB_PENDING_TTL)
+        future = _job_executor.submit(_process_optimization, data, run_quantum, want_insights)
+        future.add_done_callback(lambda done: _store_job(job_id, done))
+        return job_id
+    
+    _evict_expired_jobs()
+    future = _job_executor.submit(_process_optimization, data, run_quantum, want_insights)
+    with _jobs_lock:
+        _jobs[job_id] = (future, time.monotonic())
+    return job_id
+
+def _job_state(job_id, future):
+    """
+    Describe a job by its future.
+
+    Args:
+        job_id: Id of the job, used in log messages
+        future: Future of the job's _process_optimization call
+
+    Returns:
+        Dictionary with 'status' ('pending', 'done' or 'failed') plus the
+        result and its HTTP status code ('result', 'code') or the 'error'
+    """
+    if not future.done():
+        return {'status': 'pending'}
+    try:
+        result, status = future.result()
+    except Exception as e:
+        logger.error("Optimization job %s failed: %s", job_id, e)
+        return {'status': 'failed', 'error': f'Optimization failed: {str(e)}'}
+    return {'status': 'done', 'result': result, 'code': status}
+
+def _store_job(job_id, future):
+    """Write a finished job's state to Redis, where it expires after JOB_RESULT_TTL seconds"""
+    try:
+        _job_redis.set(_JOB_KEY_PREFIX + job_id, app.json.dumps(_job_state(job_id, future)),
+                       ex=config.JOB_RESULT_TTL)
+    except Exception as e:
+        logger.error("Could not store the result of optimization job %s: %s", job_id, e)
+
+def _load_job(job_id):
+    """Return the _job_state of a job, or None if it is unknown or expired"""
+    if _job_redis is not None:
+        raw = _job_redis.get(_JOB_KEY_PREFIX + job_id)
+        return app.json.loads(raw) if raw is not None else None
+    
+    _evict_expired_jobs()
+    with _jobs_lock:
+        job = _jobs.get(job_id)
+    return _job_state(job_id, job[0]) if job is not None else None
+
+def _evict_expired_jobs():
+    """Drop finished jobs older than JOB_RESULT_TTL seconds"""
+    cutoff = time.monotonic() - config.JOB_RESULT_TTL
+    with _jobs_lock:
+        expired = [job_id for job_id, (future, submitted) in _jobs.items()
+                   if submitted < cutoff and future.done()]
+        for job_id in expired:
+            del _jobs[job_id]
+
+@app.route('/optimize/batch', methods=['POST'])
+@limiter.limit(config.OPTIMIZE_RATE_LIMIT, override_defaults=False)
+@limiter.limit(config.BATCH_ENTRY_RATE_LIMIT, override_defaults=False, cost=_batch_cost)
+def optimize_batch():
+    """
+    Process several optimization requests in one call.
+
+    Each entry of "requests" is handled like an /optimize body and gets its own
+    result, so a failing entry does not fail the batch. The whole batch
+    shares one deadline, BATCH_REQUEST_TIMEOUT seconds (5s by default) after
+    it starts; entries without a result by then are reported as timed out.
+
+    Classical runs are spread over a thread pool. Queued entries are
+    cancelled at the deadline, but an entry that is already running can't be
+    interrupted and keeps its pool thread until it finishes. Quantum runs are
+    sequential on the request thread; the deadline is checked before each
+    entry starts, so only the entry running when it passes can overrun it.
+    """
+    try:
+        data = _get_json_body()
+        batch = data.get('requests') if isinstance(data, dict) else None
+        
+        if not isinstance(batch, list) or len(batch) == 0:
+            return jsonify({'success': False, 'error': 'Expected a non-empty "requests" list'}), 400
+        if len(batch) > config.MAX_BATCH_SIZE:
+            return jsonify({'success': False, 'error': f'At most {config.MAX_BATCH_SIZE} requests per batch'}), 400
+        
+        use_quantum_param = request.args.get('quantum', 'true').lower() == 'true'
+        run_quantum = use_quantum and use_quantum_param
+        want_insights = _wants_insights()
+        logger.info("Received batch optimization request with %d entries", len(batch))
+        
+        deadline = time.monotonic() + config.BATCH_REQUEST_TIMEOUT
+        timed_out = {'success': False, 'error': 'Optimization timed out'}
+        
+        if run_quantum:
+            # Quantum runs share one optimizer instance and are kept sequential
+            results = []
+            for entry in batch:
+                if time.monotonic() >= deadline:
+                    results.append(timed_out)
+                else:
+                    results.append(_process_batch_entry(entry, True, want_insights))
+        else:
+            futures = [_batch_executor.submit(_process_batch_entry, entry, False, want_insights)
+                       for entry in batch]
+            concurrent.futures.wait(futures, timeout=max(0.0, deadline - time.monotonic()))
+            results = []
+            for future in futures:
+                if future.done():
+                    results.append(future.result())
+                else:
+                    future.cancel()  # Only stops entries still waiting in the queue
+                    results.append(timed_out)
+        
+        return jsonify({'success': True, 'results': results})
+    
+    except HTTPException as e:
+        return jsonify({'success': False, 'error': e.description}), e.code
+    except Exception as e:
+        logger.error("Error in batch optimization process: %s", e)
+        return jsonify({'success': False, 'error': f'Batch optimization failed: {str(e)}'}), 500
+
+def _process_batch_entry(data, run_quantum, want_insights=True):
+    """Run one batch entry, turning any failure into an error result"""
+    try:
+        return _process_optimization(data, run_quantum, want_insights)[0]
+    except Exception as e:
+        logger.error("Batch entry failed: %s", e)
+        return {'success': False, 'error': f'Optimization failed: {str(e)}'}
+
+def _wants_insights():
+    """Whether the request wants insights; ?insights=none (or false) skips them"""
+    return request.args.get('insights', 'true').lower() not in ('none', 'false')
+
+def _process_optimization(data, run_quantum, want_insights=True):
+    """
+    Validate one optimization request, run it and attach insights.
+
+    Args:
+        data: Request body with budget, deadline, developers and projects
+        run_quantum: Whether to use the quantum-powered optimizer
+        want_insights: Whether to generate insights (an OpenAI round trip when
+            enabled) and merge them into the result
+
+    Returns:
+        Tuple of (response dictionary, HTTP status code)
+    """
+    # Validate input data
+    if not isinstance(data, dict) or not _validate_input(data):
+        logger.error("Input validation failed")
+        return {'success': False, 'error': 'Invalid input data'}, 400
+    
+    try:
+        if run_quantum:
+            # Run quantum-powered optimization algorithm
+            logger.info("Using quantum-powered optimization")
+            optimization_result = quantum_opt.optimize(
+                data['budget'],
+                data['deadline'],
+                data['developers'],
+                data['projects']
+            )
+        else:
+            # Run classical optimization algorithm
+            logger.info("Using classical optimization")
+            optimization_result = optimizer.run_optimization(
+                data['budget'],
+                data['deadline'],
+                data['developers'],
+                data['projects']
+            )
             
-            logger.info("Insights generation completed successfully")
-        except Exception as insights_error:
-            logger.error(f"Insights generation failed: {str(insights_error)}")
-            # Fall back to deterministic insights on failure
+        logger.info("Optimization completed successfully with %d assignments", len(optimization_result.get('assignments', [])))
+    except Exception as opt_error:
+        logger.error("Optimization algorithm failed: %s", opt_error)
+        return {'success': False, 'error': f'Optimization algorithm failed: {str(opt_error)}'}, 500
+    
+    # Combine results in place; optimization_result is freshly built per request
+    optimization_result['success'] = True
+    
+    if not want_insights:
+        logger.info("Skipping insights generation")
+        return optimization_result, 200
+    
+    try:
+        # Generate AI insights - try OpenAI first, fall back to deterministic
+        if use_openai:
+            logger.info("Generating OpenAI-powered insights")
+            insights = openai_gen.generate_insights(
+                data, 
+                optimization_result
+            )
+        else:
+            logger.info("Using deterministic insights")
             insights = ai_insights.generate_insights(
                 data, 
                 optimization_result
             )
         
-        # Combine results
-        result = {**optimization_result, **{'success': True}, **insights}
-        
-        return jsonify(result)
+        logger.info("Insights generation completed successfully")
+    except Exception as insights_error:
+        logger.error("Insights generation failed: %s", insights_error)
+        # Fall back to deterministic insights on failure
+        insights = ai_insights.generate_insights(
+            data, 
+            optimization_result
+        )
     
-    except Exception as e:
-        logger.error(f"Error in optimization process: {str(e)}")
-        return jsonify({'success': False, 'error': f'Optimization failed: {str(e)}'}), 500
+    optimization_result.update(insights)
+    
+    return optimization_result, 200
+
+# Exact-type checks for JSON numbers are cheaper than isinstance and reject bools
+_NUMERIC_TYPES = (int, float)
+_REQUIRED_FIELDS = ('budget', 'deadline', 'developers', 'projects')
+_REQUIRED_DEV_FIELDS = frozenset({'name', 'rate', 'hours_per_day', 'skills'})
+_REQUIRED_PROJECT_FIELDS = frozenset({'name', 'hours', 'priority'})
 
 def _validate_input(data):
     """Validate the input data"""
     try:
         # Check required fields
-        required_fields = ['budget', 'deadline', 'developers', 'projects']
-        for field in required_fields:
+        for field in _REQUIRED_FIELDS:
             if field not in data:
-                logging.error(f"Missing required field: {field}")
+                logging.error("Missing required field: %s", field)
                 return False
         
         # Validate numeric values
-        if not isinstance(data['budget'], (int, float)) or data['budget'] <= 0:
+        budget = data['budget']
+        if type(budget) not in _NUMERIC_TYPES or budget <= 0:
             logging.error("Budget must be a positive number")
             return False
         
-        if not isinstance(data['deadline'], (int, float)) or data['deadline'] <= 0:
+        deadline = data['deadline']
+        if type(deadline) not in _NUMERIC_TYPES or deadline <= 0:
             logging.error("Deadline must be a positive number")
             return False
         
         # Validate developers
-        if not isinstance(data['developers'], list) or len(data['developers']) == 0:
+        developers = data['developers']
+        if not developers or type(developers) is not list:
             logging.error("At least one developer is required")
             return False
         
-        for dev in data['developers']:
-            if not all(key in dev for key in ['name', 'rate', 'hours_per_day', 'skills']):
+        for dev in developers:
+            if not _REQUIRED_DEV_FIELDS.issubset(dev):
                 logging.error("Developer missing required fields")
                 return False
-            if not isinstance(dev['rate'], (int, float)) or dev['rate'] <= 0:
+            rate = dev['rate']
+            if type(rate) not in _NUMERIC_TYPES or rate <= 0:
                 logging.error("Developer rate must be a positive number")
                 return False
-            if not isinstance(dev['hours_per_day'], (int, float)) or dev['hours_per_day'] <= 0:
+            hours_per_day = dev['hours_per_day']
+            if type(hours_per_day) not in _NUMERIC_TYPES or hours_per_day <= 0:
                 logging.error("Developer hours_per_day must be a positive number")
                 return False
         
         # Validate projects
-        if not isinstance(data['projects'], list) or len(data['projects']) == 0:
+        projects = data['projects']
+        if not projects or type(projects) is not list:
             logging.error("At least one project is required")
             return False
         
-        for proj in data['projects']:
-            if not all(key in proj for key in ['name', 'hours', 'priority']):
+        for proj in projects:
+            if not _REQUIRED_PROJECT_FIELDS.issubset(proj):
                 logging.error("Project missing required fields")
                 return False
-            if not isinstance(proj['hours'], (int, float)) or proj['hours'] <= 0:
+            hours = proj['hours']
+            if type(hours) not in _NUMERIC_TYPES or hours <= 0:
                 logging.error("Project hours must be a positive number")
                 return False
-            if not isinstance(proj['priority'], (int, float)) or proj['priority'] < 1 or proj['priority'] > 5:
+            priority = proj['priority']
+            if type(priority) not in _NUMERIC_TYPES or priority < 1 or priority > 5:
                 logging.error("Project priority must be between 1 and 5")
                 return False
         
         return True
     
     except Exception as e:
-        logging.error(f"Validation error: {str(e)}")
+        logging.error("Validation error: %s", e)
         return False
 
 @app.route('/quantum-playground')
@@ -247,62 +566,120 @@ def quantum_playground_page():
     backends = quantum_playground_instance.get_available_backends()
     return render_template('quantum_playground.html', backends=backends)
 
+# Request fields as (key, default, check, error): each value is read once, and a
+# failed check becomes a 400 with the error message via the HTTPException handler
+_CREATE_CIRCUIT_FIELDS = (
+    ('num_qubits', 2, lambda v: type(v) is int and 1 <= v <= 12, 'Invalid number of qubits'),
+    ('circuit_type', 'empty', None, None),
+)
+_RUN_CIRCUIT_FIELDS = (
+    ('circuit', None, bool, 'No circuit provided'),
+    ('backend', 'qasm_simulator', None, None),
+    ('shots', 1024, lambda v: type(v) is int and 1 <= v <= 10000, 'Shots must be between 1 and 10,000'),
+)
+_RUN_CIRCUITS_FIELDS = (
+    ('circuits', None, lambda v: type(v) is list and 1 <= len(v) <= config.MAX_BATCH_SIZE,
+     f'Expected a list of 1 to {config.MAX_BATCH_SIZE} circuits'),
+) + _RUN_CIRCUIT_FIELDS[1:]
+
+def _unpack_fields(data, fields):
+    """
+    Read and validate request fields in a single pass.
+
+    Args:
+        data: Parsed JSON request body
+        fields: Tuple of (key, default, check, error) field specs
+
+    Returns:
+        List of field values in spec order
+
+    Raises:
+        BadRequest: With the error of the first field that fails its check
+    """
+    if not isinstance(data, dict):
+        raise BadRequest('Request body must be a JSON object')
+    
+    get = data.get
+    values = []
+    for key, default, check, error in fields:
+        value = get(key, default)
+        if check is not None and not check(value):
+            raise BadRequest(error)
+        values.append(value)
+    return values
+
 @app.route('/quantum/create-circuit', methods=['POST'])
 def create_quantum_circuit():
     """Create a quantum circuit based on the specified parameters"""
     try:
         # Get input data from request
-        data = request.json
-        num_qubits = data.get('num_qubits', 2)
-        circuit_type = data.get('circuit_type', 'empty')
-        
-        # Validate input
-        if not isinstance(num_qubits, int) or num_qubits < 1 or num_qubits > 12:
-            return jsonify({'success': False, 'error': 'Invalid number of qubits'}), 400
+        data = _get_json_body()
+        num_qubits, circuit_type = _unpack_fields(data, _CREATE_CIRCUIT_FIELDS)
             
         # Create the circuit
         result = quantum_playground_instance.create_circuit(num_qubits, circuit_type)
         
         if not result.get('success', False):
-            logger.error(f"Circuit creation error: {result.get('error', 'Unknown error')}")
+            logger.error("Circuit creation error: %s", result.get('error', 'Unknown error'))
             return jsonify(result), 400
             
-        logger.info(f"Successfully created {circuit_type} circuit with {num_qubits} qubits")
+        logger.info("Successfully created %s circuit with %s qubits", circuit_type, num_qubits)
         return jsonify(result)
         
+    except HTTPException as e:
+        return jsonify({'success': False, 'error': e.description}), e.code
     except Exception as e:
-        logger.error(f"Error creating quantum circuit: {str(e)}")
+        logger.error("Error creating quantum circuit: %s", e)
         return jsonify({'success': False, 'error': f'Circuit creation failed: {str(e)}'}), 500
 
 @app.route('/quantum/run-circuit', methods=['POST'])
+@limiter.limit(config.RUN_CIRCUIT_RATE_LIMIT, override_defaults=False)
 def run_quantum_circuit():
     """Run a quantum circuit simulation"""
     try:
         # Get input data from request
-        data = request.json
-        circuit = data.get('circuit')
-        backend = data.get('backend', 'qasm_simulator')
-        shots = data.get('shots', 1024)
-        
-        # Validate input
-        if not circuit:
-            return jsonify({'success': False, 'error': 'No circuit provided'}), 400
-            
-        if not isinstance(shots, int) or shots < 1 or shots > 10000:
-            return jsonify({'success': False, 'error': 'Shots must be between 1 and 10,000'}), 400
+        data = _get_json_body()
+        circuit, backend, shots = _unpack_fields(data, _RUN_CIRCUIT_FIELDS)
             
         # Run the circuit
         result = quantum_playground_instance.run_circuit(circuit, backend, shots)
         
         if not result.get('success', False):
-            logger.error(f"Circuit simulation error: {result.get('error', 'Unknown error')}")
+            logger.error("Circuit simulation error: %s", result.get('error', 'Unknown error'))
+            return jsonify(result), 400
+            
+        logger.info("Successfully ran circuit simulation on %s with %s shots", backend, shots)
+        return jsonify(result)
+        
+    except HTTPException as e:
+        return jsonify({'success': False, 'error': e.description}), e.code
+    except Exception as e:
+        logger.error("Error running quantum circuit: %s", e)
+        return jsonify({'success': False, 'error': f'Circuit simulation failed: {str(e)}'}), 500
+
+@app.route('/quantum/run-circuits', methods=['POST'])
+@limiter.limit(config.RUN_CIRCUIT_RATE_LIMIT, override_defaults=False)
+def run_quantum_circuits():
+    """Run several quantum circuits as one batch, e.g. for parameter sweeps"""
+    try:
+        # Get input data from request
+        data = _get_json_body()
+        circuits, backend, shots = _unpack_fields(data, _RUN_CIRCUITS_FIELDS)
+        
+        # Run the circuits
+        result = quantum_playground_instance.run_circuits(circuits, backend, shots)
+        
+        if not result.get('success', False):
+            logger.error("Circuit batch simulation error: %s", result.get('error', 'Unknown error'))
             return jsonify(result), 400
             
-        logger.info(f"Successfully ran circuit simulation on {backend} with {shots} shots")
+        logger.info("Successfully ran %d circuits on %s with %s shots", len(circuits), backend, shots)
         return jsonify(result)
         
+    except HTTPException as e:
+        return jsonify({'success': False, 'error': e.description}), e.code
     except Exception as e:
-        logger.error(f"Error running quantum circuit: {str(e)}")
+        logger.error("Error running quantum circuits: %s", e)
         return jsonify({'success': False, 'error': f'Circuit simulation failed: {str(e)}'}), 500
 
 @app.route('/quantum/backends', methods=['GET'])
@@ -312,8 +689,10 @@ def get_quantum_backends():
         backends = quantum_playground_instance.get_available_backends()
         return jsonify({'success': True, 'backends': backends})
     except Exception as e:
-        logger.error(f"Error getting quantum backends: {str(e)}")
+        logger.error("Error getting quantum backends: %s", e)
         return jsonify({'success': False, 'error': f'Failed to get backends: {str(e)}'}), 500
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    # Development server only; debug mode is opt-in via DEBUG=true. In
+    # production run under gunicorn, which picks up gunicorn.conf.py.
+    app.run(host=config.HOST, port=config.PORT, debug=config.DEBUG)
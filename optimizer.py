@@ -1,13 +1,67 @@
 # bunny
+import heapq
+import json
 import numpy as np
 import logging
+from collections import Counter, defaultdict, namedtuple
+from functools import lru_cache
 from typing import Dict, List, Any
 import math
 
+# Numba is optional; without it the NumPy/pure-Python paths below are used
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+    # Numba logs every compiler pass at DEBUG; keep that out of the application log
+    logging.getLogger('numba').setLevel(logging.WARNING)
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Set up logging
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+# Below this many assignments the risk kernel's array building costs more than it saves
+NUMBA_MIN_ASSIGNMENTS = 200
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _score_developers(rates, availability, skill_match, project_hours, project_priority):
+        """Return the index of the highest-amplitude available developer (first on ties), or -1"""
+        priority_factor = project_priority / 5
+        best_idx = -1
+        best_amplitude = 0.0
+        for i in range(rates.shape[0]):
+            if availability[i] < project_hours:
+                continue
+            amplitude = (1.0 / (project_hours * rates[i] + 1)) * (skill_match[i] / 100) ** priority_factor
+            if best_idx == -1 or amplitude > best_amplitude:
+                best_idx = i
+                best_amplitude = amplitude
+        return best_idx
+    
+    @njit(cache=True)
+    def _count_assignment_risks(skill_matches, dev_codes, num_devs):
+        """Return (low skill match count, projects per developer code)"""
+        low_skill = 0
+        counts = np.zeros(num_devs, dtype=np.int64)
+        for k in range(skill_matches.shape[0]):
+            if skill_matches[k] < 70:
+                low_skill += 1
+            counts[dev_codes[k]] += 1
+        return low_skill, counts
+    
+    # Compile at import so the first /optimize request doesn't pay for it.
+    # rates and skill_match arrive read-only from the _prepare cache, while
+    # availability is a fresh writable array, so the warm-up matches that
+    _warm_rates = np.ones(1)
+    _warm_skill_match = np.full(1, 100, dtype=np.int64)
+    for _warm_array in (_warm_rates, _warm_skill_match):
+        _warm_array.flags.writeable = False
+    _score_developers(_warm_rates, np.ones(1), _warm_skill_match, 1.0, 3.0)
+    del _warm_rates, _warm_skill_match, _warm_array
+    _count_assignment_risks(np.full(1, 100.0), np.zeros(1, dtype=np.int64), 1)
+
 def run_optimization(budget: float, deadline: float, 
                      developers: List[Dict[str, Any]], 
                      projects: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -23,12 +77,18 @@ def run_optimization(budget: float, deadline: float,
     Returns:
         Dictionary with optimization results including assignments, costs, and metrics
     """
-    logger.info(f"Starting optimization with budget ${budget}, deadline {deadline} days")
-    logger.info(f"Optimizing for {len(developers)} developers and {len(projects)} projects")
+    logger.info("Starting optimization with budget $%s, deadline %s days", budget, deadline)
+    logger.info("Optimizing for %d developers and %d projects", len(developers), len(projects))
     
     try:
-        # Create dependency graph and determine execution order
-        ordered_projects = _resolve_dependencies(projects)
+        # Execution order and developer arrays, cached across requests
+        # with the same developers and projects
+        prepared = _prepare(
+            json.dumps(developers, sort_keys=True),
+            json.dumps(projects, sort_keys=True)
+        )
+        ordered_projects = [projects[j] for j in prepared.project_order]
+        rates = prepared.rates
         
         # Initialize result structure
         assignments = []
@@ -36,21 +96,22 @@ def run_optimization(budget: float, deadline: float,
         max_days = 0
         
         # Track developer availability (remaining hours)
-        dev_availability = {dev['name']: dev['hours_per_day'] * deadline for dev in developers}
+        availability = prepared.hours_per_day * deadline
         
         # Quantum-inspired assignment algorithm
-        for project in ordered_projects:
+        for project, skill_match_row in zip(ordered_projects, prepared.skill_match):
             # Find the best developer for this project
-            best_dev, hours_needed, cost, skill_match = _assign_best_developer(
-                project, developers, dev_availability
+            best_idx, hours_needed, cost, skill_match = _assign_best_developer(
+                project, rates, availability, skill_match_row
             )
+            best_dev = developers[best_idx]
             
             # Calculate days needed for this project with the assigned developer
             days_needed = hours_needed / best_dev['hours_per_day']
             max_days = max(max_days, days_needed)
             
             # Update developer availability
-            dev_availability[best_dev['name']] -= hours_needed
+            availability[best_idx] -= hours_needed
             
             # Update total cost
             total_cost += cost
@@ -80,114 +141,203 @@ def run_optimization(budget: float, deadline: float,
         return result
     
     except Exception as e:
-        logger.error(f"Optimization failed: {str(e)}")
+        logger.error("Optimization failed: %s", e)
         raise
 
+# Request-independent preprocessing of a developer/project payload
+PreparedInput = namedtuple('PreparedInput', [
+    'project_order',  # Indices into projects, in execution order
+    'rates',          # Hourly rate of each developer
+    'hours_per_day',  # Daily hours of each developer
+    'skill_match'     # Skill match % of each developer (columns) for each
+                      # project in execution order (rows)
+])
+
+@lru_cache(maxsize=64)
+def _prepare(developers_json: str, projects_json: str) -> PreparedInput:
+    """
+    Preprocess developers and projects, memoized on their canonical JSON
+    
+    Args:
+        developers_json: Developers serialized with sorted keys
+        projects_json: Projects serialized with sorted keys
+    
+    Returns:
+        PreparedInput with read-only arrays shared by every cache hit
+    """
+    developers = json.loads(developers_json)
+    projects = json.loads(projects_json)
+    
+    # Map the resolved order back to input positions (last project wins on
+    # duplicate names, as in _resolve_dependencies)
+    position = {p['name']: j for j, p in enumerate(projects)}
+    project_order = tuple(position[p['name']] for p in _resolve_dependencies(projects))
+    
+    rates = np.array([dev['rate'] for dev in developers], dtype=np.float64)
+    hours_per_day = np.array([dev['hours_per_day'] for dev in developers], dtype=np.float64)
+    
+    # Skill matching only depends on the payload, so skills are lowercased and
+    # matched here once instead of on every assignment
+    skill_match = _build_skill_match(developers, [projects[j] for j in project_order])
+    for array in (rates, hours_per_day, skill_match):
+        array.flags.writeable = False
+    
+    return PreparedInput(project_order, rates, hours_per_day, skill_match)
+
 def _resolve_dependencies(projects: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     Resolve project dependencies and return projects in execution order.
     
+    Projects are topologically sorted with Kahn's algorithm. Whenever several
+    projects are ready, the one with the highest priority is scheduled first,
+    so priority ordering never places a project before its dependencies.
+    
     Args:
         projects: List of project dictionaries
     
     Returns:
-        Ordered list of projects respecting dependencies
+        Ordered list of the input project dicts respecting dependencies
     """
-    # Create a copy to avoid modifying the original
-    projects_copy = [p.copy() for p in projects]
-    
-    # Build dependency graph
-    dependency_graph = {}
-    for project in projects_copy:
-        project_name = project['name']
-        dependency_graph[project_name] = project.get('dependencies', [])
-    
-    # Topological sort
-    visited = set()
-    temp = set()
-    ordered = []
-    
-    def visit(project_name):
-        if project_name in temp:
-            raise ValueError(f"Circular dependency detected involving {project_name}")
-        if project_name not in visited:
-            temp.add(project_name)
-            for dep in dependency_graph.get(project_name, []):
-                if dep:  # Skip empty dependencies
-                    visit(dep)
-            temp.remove(project_name)
-            visited.add(project_name)
-            ordered.append(project_name)
-    
-    # Visit each project
-    for project_name in dependency_graph:
-        if project_name not in visited:
-            visit(project_name)
-    
-    # Reorder the original projects list based on the dependency order
-    project_map = {p['name']: p for p in projects_copy}
-    ordered_projects = [project_map[name] for name in ordered]
-    
-    # Sort by priority for projects without dependencies
-    ordered_projects.sort(key=lambda x: -x.get('priority', 1))
+    # One node per project name, in first-seen order. The graph is built over
+    # the caller's dicts, which are never modified, and the result references them.
+    project_map = {}
+    for project in projects:
+        project_map[project['name']] = project
+    position = {name: i for i, name in enumerate(project_map)}
+    
+    # Build dependency graph: edges run from a dependency to its dependents.
+    # Empty and unknown dependency names are ignored.
+    in_degree = {name: 0 for name in project_map}
+    dependents = defaultdict(list)
+    for name, project in project_map.items():
+        for dep in set(project.get('dependencies', [])):
+            if dep in project_map:
+                dependents[dep].append(name)
+                in_degree[name] += 1
+    
+    # Kahn's algorithm; among ready projects the highest priority goes first,
+    # ties broken by input order
+    def ready_key(name):
+        return (-project_map[name].get('priority', 1), position[name], name)
+    
+    ready = [ready_key(name) for name, degree in in_degree.items() if degree == 0]
+    heapq.heapify(ready)
+    ordered_projects = []
+    while ready:
+        name = heapq.heappop(ready)[2]
+        ordered_projects.append(project_map[name])
+        for dependent in dependents[name]:
+            in_degree[dependent] -= 1
+            if in_degree[dependent] == 0:
+                heapq.heappush(ready, ready_key(dependent))
+    
+    if len(ordered_projects) != len(project_map):
+        blocked = [name for name, degree in in_degree.items() if degree > 0]
+        raise ValueError(f"Circular dependency detected involving {', '.join(blocked)}")
     
     return ordered_projects
 
+def _build_skill_matrix(developers: List[Dict[str, Any]]) -> tuple:
+    """
+    Build a developer x skill matrix over the lowercased developer skills
+    
+    Args:
+        developers: List of developer dictionaries
+    
+    Returns:
+        Tuple of (skill -> column index dict, uint8 matrix with a 1 where the
+        developer has the skill)
+    """
+    skill_index = {}
+    rows = []
+    for dev in developers:
+        rows.append([skill_index.setdefault(s.lower(), len(skill_index)) for s in dev['skills']])
+    
+    skill_matrix = np.zeros((len(developers), len(skill_index)), dtype=np.uint8)
+    for i, columns in enumerate(rows):
+        skill_matrix[i, columns] = 1
+    
+    return skill_index, skill_matrix
+
+def _build_skill_match(developers: List[Dict[str, Any]],
+                       projects: List[Dict[str, Any]]) -> np.ndarray:
+    """
+    Compute the skill match percentage of every developer for every project
+    
+    Required skills no developer has never match; developers without skills
+    and projects without required skills match 100%.
+    
+    Args:
+        developers: List of developer dictionaries
+        projects: List of project dictionaries
+    
+    Returns:
+        int64 matrix with one row per project and one column per developer
+    """
+    skill_index, skill_matrix = _build_skill_matrix(developers)
+    has_skills = np.array([bool(dev['skills']) for dev in developers], dtype=bool)
+    
+    skill_match = np.full((len(projects), len(developers)), 100, dtype=np.int64)
+    for row, project in zip(skill_match, projects):
+        project_skills = project.get('required_skills', [])
+        if project_skills:
+            required = {skill_index[s] for s in set(s.lower() for s in project_skills) if s in skill_index}
+            matched = skill_matrix[:, list(required)].sum(axis=1)
+            row[has_skills] = (matched[has_skills] / len(project_skills) * 100).astype(np.int64)
+    
+    return skill_match
+
 def _assign_best_developer(project: Dict[str, Any], 
-                          developers: List[Dict[str, Any]],
-                          availability: Dict[str, float]) -> tuple:
+                          rates: np.ndarray,
+                          availability: np.ndarray,
+                          skill_match: np.ndarray) -> tuple:
     """
     Assign the best developer to a project using quantum-inspired probability amplitudes
     
+    Amplitudes are computed by the compiled _score_developers kernel when Numba
+    is available, otherwise as one vectorized NumPy expression picked with argmax.
+    
     Args:
         project: Project dictionary
-        developers: List of developer dictionaries
-        availability: Dict of remaining available hours for each developer
+        rates: Hourly rate of each developer
+        availability: Remaining available hours of each developer
+        skill_match: Skill match percentage of each developer for this project
     
     Returns:
-        Tuple of (best developer, hours needed, cost, skill match percentage)
+        Tuple of (best developer index, hours needed, cost, skill match percentage)
     """
     project_hours = project['hours']
     project_priority = project.get('priority', 3)
-    project_skills = project.get('required_skills', [])
     
-    # Calculate "quantum amplitudes" for each developer
-    amplitudes = []
-    
-    for dev in developers:
-        # Skip if developer doesn't have enough availability
-        if availability[dev['name']] < project_hours:
-            continue
-        
-        # Calculate skill match
-        skill_match = 100
-        if project_skills and dev['skills']:
-            matched_skills = set(s.lower() for s in dev['skills']) & set(s.lower() for s in project_skills)
-            skill_match = int(len(matched_skills) / len(project_skills) * 100) if project_skills else 100
-        
-        # Calculate cost
-        cost = project_hours * dev['rate']
-        
-        # Create a quantum-inspired amplitude based on multiple factors
-        # Higher amplitude = better match
-        cost_factor = 1.0 / (cost + 1)  # Lower cost = higher amplitude
-        skill_factor = skill_match / 100  # Higher skill match = higher amplitude
-        priority_factor = project_priority / 5  # Higher priority = favor skilled developers
-        
-        # Combined amplitude with quantum-inspired weighting
-        amplitude = cost_factor * (skill_factor ** priority_factor)
-        
-        amplitudes.append((dev, amplitude, cost, skill_match))
+    if NUMBA_AVAILABLE:
+        # Compiled scoring loop; -1 means no developer has enough availability
+        best_idx = _score_developers(rates, availability, skill_match,
+                                     float(project_hours), float(project_priority))
+    else:
+        # Skip developers that don't have enough availability
+        available = availability >= project_hours
+        best_idx = -1
+        if available.any():
+            # Calculate cost
+            costs = project_hours * rates
+            
+            # Create a quantum-inspired amplitude based on multiple factors
+            # Higher amplitude = better match
+            cost_factor = 1.0 / (costs + 1)  # Lower cost = higher amplitude
+            skill_factor = skill_match / 100  # Higher skill match = higher amplitude
+            priority_factor = project_priority / 5  # Higher priority = favor skilled developers
+            
+            # Combined amplitude with quantum-inspired weighting
+            amplitudes = np.where(available, cost_factor * skill_factor ** priority_factor, -np.inf)
+            
+            # Best match (first one on ties)
+            best_idx = int(np.argmax(amplitudes))
     
-    if not amplitudes:
+    if best_idx == -1:
         raise ValueError(f"No developer has enough availability for project {project['name']}")
     
-    # Sort by amplitude in descending order
-    amplitudes.sort(key=lambda x: x[1], reverse=True)
-    
-    # Return the best match
-    best_dev, _, cost, skill_match = amplitudes[0]
-    return best_dev, project_hours, cost, skill_match
+    cost = float(project_hours * rates[best_idx])
+    return best_idx, project_hours, cost, int(skill_match[best_idx])
 
 def _identify_risks(assignments: List[Dict[str, Any]], 
                    budget: float, deadline: float, 
@@ -233,19 +383,32 @@ def _identify_risks(assignments: List[Dict[str, Any]],
             'severity': 'medium'
         })
     
+    if NUMBA_AVAILABLE and len(assignments) >= NUMBA_MIN_ASSIGNMENTS:
+        # Encode developer names as dense codes and count in compiled code
+        dev_codes_map = {}
+        dev_codes = np.fromiter((dev_codes_map.setdefault(a['developer'], len(dev_codes_map)) for a in assignments),
+                                dtype=np.int64, count=len(assignments))
+        skill_matches = np.fromiter((a['skill_match'] for a in assignments),
+                                    dtype=np.float64, count=len(assignments))
+        low_skill_count, counts = _count_assignment_risks(skill_matches, dev_codes, len(dev_codes_map))
+        dev_project_counts = {name: int(counts[code]) for name, code in dev_codes_map.items()}
+    else:
+        # Single pass: count low skill matches and projects per developer together
+        low_skill_count = 0
+        dev_project_counts = Counter()
+        for a in assignments:
+            if a['skill_match'] < 70:
+                low_skill_count += 1
+            dev_project_counts[a['developer']] += 1
+    
     # Skill match risks
-    low_skill_matches = [a for a in assignments if a['skill_match'] < 70]
-    if low_skill_matches:
+    if low_skill_count:
         risks.append({
-            'message': f'{len(low_skill_matches)} assignments have low skill matches',
-            'severity': 'medium' if len(low_skill_matches) < 3 else 'high'
+            'message': f'{low_skill_count} assignments have low skill matches',
+            'severity': 'medium' if low_skill_count < 3 else 'high'
         })
     
     # Developer overallocation risk
-    dev_project_counts = {}
-    for a in assignments:
-        dev_project_counts[a['developer']] = dev_project_counts.get(a['developer'], 0) + 1
-    
     overallocated_devs = [d for d, count in dev_project_counts.items() if count > 2]
     if overallocated_devs:
         risks.append({
@@ -2,43 +2,23 @@
 """
 Quantum-powered optimizer using IBM Qiskit for AQWSE
 """
+import itertools
 import logging
+import threading
+from collections import OrderedDict, namedtuple
 import numpy as np
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 
-# Import Qiskit libraries with compatibility handling
-# The imports are structured to handle different versions of Qiskit
-try:
-    # Try importing from the new structure
-    from qiskit_aer import Aer
-except ImportError:
-    # Fall back to the old structure if needed
-    try:
-        from qiskit import Aer
-    except ImportError:
-        # Define a fallback simulator if neither import works
-        class FallbackAer:
-            @staticmethod
-            def get_backend(name):
-                return None
-        Aer = FallbackAer()
+# Fallback stand-ins for Qiskit components that are not installed
+class FallbackIBMQ:
+    @staticmethod
+    def save_account(token, overwrite=False):
+        pass
         
-# Handle IBMQ import - may not be available in newer versions
-try:
-    from qiskit import IBMQ
-except ImportError:
-    # Define a fallback if import fails
-    class FallbackIBMQ:
-        @staticmethod
-        def save_account(token, overwrite=False):
-            pass
-            
-        @staticmethod
-        def load_account():
-            return None
-    IBMQ = FallbackIBMQ()
+    @staticmethod
+    def load_account():
+        return None
 
-# Define fallback classes for other components that might not be available
 class FallbackQuadraticProgram:
     def __init__(self, name=None):
         self.name = name
@@ -48,22 +28,20 @@ class FallbackQuadraticProgram:
         self.variables.append(name)
         return 0
         
+    def binary_var_list(self, keys, name=None):
+        names = [f"{name or ''}{key}" for key in keys]
+        self.variables.extend(names)
+        return [0] * len(names)
+        
     def get_variable(self, name):
         return 0
         
     def linear_constraint(self, linear=None, sense=None, rhs=None, name=None):
         pass
         
-    def minimize(self, linear=None, quadratic=None):
+    def minimize(self, constant=None, linear=None, quadratic=None):
         pass
 
-# Try to import QuadraticProgram, or use fallback
-try:
-    from qiskit_optimization import QuadraticProgram
-except ImportError:
-    QuadraticProgram = FallbackQuadraticProgram
-
-# Define fallback for QAOA and related components
 class FallbackSampler:
     pass
 
@@ -86,38 +64,112 @@ class FallbackMinimumEigenOptimizer:
                 
         return Result()
 
-# Try to import QAOA and related components, or use fallbacks
-try:
-    from qiskit.primitives import Sampler
-except ImportError:
-    Sampler = FallbackSampler
+# Qiskit components, bound by _ensure_qiskit() on first quantum use; Qiskit's
+# import cascade is slow and classical-only callers never need it
+IBMQ = None
+QuadraticProgram = None
+Sampler = None
+QAOA = None
+COBYLA = None
+SPSA = None
+MinimumEigenOptimizer = None
+_qiskit_loaded = False
+_qiskit_lock = threading.Lock()
 
-try:
-    from qiskit.algorithms import QAOA
-except ImportError:
-    QAOA = FallbackQAOA
+def _ensure_qiskit():
+    """
+    Import the Qiskit components on first use, or bind the fallbacks.
+    
+    The imports are structured to handle different versions of Qiskit.
+    """
+    global IBMQ, QuadraticProgram, Sampler, QAOA, COBYLA, SPSA, MinimumEigenOptimizer
+    global _qiskit_loaded
+    if _qiskit_loaded:
+        return
+    with _qiskit_lock:
+        if _qiskit_loaded:
+            return
 
-try:
-    from qiskit.algorithms.optimizers import COBYLA
-except ImportError:
-    COBYLA = FallbackCOBYLA
+        # Handle IBMQ import - may not be available in newer versions
+        try:
+            from qiskit import IBMQ
+        except ImportError:
+            IBMQ = FallbackIBMQ()
 
+        try:
+            from qiskit_optimization import QuadraticProgram
+        except ImportError:
+            QuadraticProgram = FallbackQuadraticProgram
+
+        try:
+            from qiskit.primitives import Sampler
+        except ImportError:
+            Sampler = FallbackSampler
+
+        try:
+            from qiskit.algorithms import QAOA
+        except ImportError:
+            QAOA = FallbackQAOA
+
+        try:
+            from qiskit.algorithms.optimizers import COBYLA
+        except ImportError:
+            COBYLA = FallbackCOBYLA
+
+        # SPSA is preferred for QAOA; COBYLA is used when it isn't available
+        try:
+            from qiskit.algorithms.optimizers import SPSA
+        except ImportError:
+            SPSA = None
+
+        try:
+            from qiskit_optimization.algorithms import MinimumEigenOptimizer
+        except ImportError:
+            MinimumEigenOptimizer = FallbackMinimumEigenOptimizer
+
+        # Seed Qiskit's own generator for reproducibility
+        try:
+            from qiskit.utils import algorithm_globals
+            algorithm_globals.random_seed = 42
+        except ImportError:
+            pass
+
+        _qiskit_loaded = True
+
+# SciPy's Hungarian solver handles the linear assignment objective exactly;
+# without it every quantum run goes through QAOA
 try:
-    from qiskit_optimization.algorithms import MinimumEigenOptimizer
+    from scipy.optimize import linear_sum_assignment
+    SCIPY_AVAILABLE = True
 except ImportError:
-    MinimumEigenOptimizer = FallbackMinimumEigenOptimizer
+    SCIPY_AVAILABLE = False
 
 # Set up logging
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
-# Try to set random seed for reproducibility
-try:
-    from qiskit.utils import algorithm_globals
-    algorithm_globals.random_seed = 42
-except ImportError:
-    # If algorithm_globals is not available, set numpy seed directly
-    np.random.seed(42)
+# Number of solved QUBOs remembered per optimizer for repeated identical problems
+QAOA_CACHE_SIZE = 32
+
+# Iteration budget of the SPSA parameter optimizer inside QAOA
+SPSA_MAXITER = 100
+
+# Problems with at most this many developer-project pairs are solved by
+# enumeration, which takes microseconds and never builds a QUBO
+EXHAUSTIVE_MAX_PAIRS = 16
+
+# Numeric fields of one optimize() call, extracted once from the
+# developer and project dictionaries
+ProblemArrays = namedtuple('ProblemArrays', [
+    'rates',          # Hourly rate of each developer
+    'hours_per_day',  # Daily hours of each developer
+    'capacities',     # Hours each developer can work before the deadline
+    'hours',          # Estimated hours of each project
+    'priorities'      # Priority of each project (3 if not given)
+])
+
+# Seed NumPy up front; Qiskit's generator is seeded when it is loaded
+np.random.seed(42)
 
 class QuantumWorkflowOptimizer:
     """
@@ -134,9 +186,19 @@ class QuantumWorkflowOptimizer:
         self.use_quantum = use_quantum
         self.ibm_token = ibm_token
         
+        # QAOA solver stack, built on first use and reused across optimize()
+        # calls, and an LRU of solutions keyed on the QUBO coefficients
+        self._eigen_optimizer = None
+        self._qaoa = None
+        self._last_params = None  # Optimal QAOA angles of the previous solve, for warm starts
+        self._solver_lock = threading.Lock()
+        self._solution_cache = OrderedDict()
+        self._solution_cache_lock = threading.Lock()
+        
         # Connect to IBM Quantum if token is provided
         self.ibm_quantum_provider = None
         if self.use_quantum and self.ibm_token:
+            _ensure_qiskit()
             try:
                 IBMQ.save_account(self.ibm_token, overwrite=True)
                 self.ibm_quantum_provider = IBMQ.load_account()
@@ -168,22 +230,52 @@ class QuantumWorkflowOptimizer:
             from optimizer import _resolve_dependencies
             ordered_projects = _resolve_dependencies(projects)
             
-            # Convert problem to QUBO (Quadratic Unconstrained Binary Optimization)
-            qubo = self._create_qubo(budget, deadline, developers, ordered_projects)
-            
-            # Solve using quantum or classical methods
-            if self.use_quantum:
-                result = self._solve_with_quantum(qubo)
-            else:
+            if not self.use_quantum:
                 # Fall back to our original optimization if quantum isn't available
                 from optimizer import run_optimization
                 return run_optimization(budget, deadline, developers, projects)
             
-            # Process results and create assignments
-            assignments = self._process_results(result, developers, ordered_projects)
+            # Skill match of every developer-project pair, shared by the QUBO
+            # and result processing
+            skill_match = _skill_match_ratios(developers, ordered_projects)
+            skill_match_pct = _skill_match_percent(skill_match)
+            
+            # Numeric fields, read out of the dictionaries once for every step below
+            arrays = _problem_arrays(developers, ordered_projects, deadline)
+            
+            # The objective is linear with one developer per project, so small
+            # problems are enumerated exactly and larger ones solved exactly as
+            # an assignment problem whenever capacities allow; QAOA is only
+            # needed when that fails
+            costs = _objective_matrix(budget, deadline, arrays, skill_match)
+            pairs = None
+            if len(developers) * len(ordered_projects) <= EXHAUSTIVE_MAX_PAIRS:
+                pairs = _solve_exhaustive(costs, arrays)
+            elif SCIPY_AVAILABLE:
+                pairs = _solve_linear_assignment(costs, arrays)
+            
+            if pairs is not None:
+                solved_with_quantum = False
+                assignments = self._build_assignments(pairs, developers, ordered_projects, skill_match_pct)
+                dev_indices = [i for i, _ in pairs]
+            else:
+                solved_with_quantum = True
+                
+                # Identical problems reuse a cached solution without building the QUBO
+                cache_key = _qubo_cache_key(costs, arrays)
+                fits = _fitting_pairs(arrays)
+                result = self._cached_solution(cache_key)
+                if result is None:
+                    # Convert problem to QUBO (Quadratic Unconstrained Binary Optimization)
+                    qubo = self._create_qubo(budget, deadline, developers, ordered_projects, skill_match, arrays)
+                    result = self._solve_with_quantum(qubo, cache_key, fits)
+                
+                # Process results and create assignments
+                assignments = self._process_results(result, developers, ordered_projects, skill_match_pct, fits, arrays)
+                dev_indices = None
             
             # Calculate costs and metrics
-            total_cost, completion_time = self._calculate_metrics(assignments, developers)
+            total_cost, completion_time = self._calculate_metrics(assignments, developers, dev_indices, arrays)
             
             # Generate risks based on budget, timeline, and skill matches
             from optimizer import _identify_risks
@@ -197,7 +289,7 @@ class QuantumWorkflowOptimizer:
                 'completion_time': round(completion_time, 1),
                 'time_buffer': round(deadline - completion_time, 1),
                 'risks': risks,
-                'quantum_powered': self.use_quantum
+                'quantum_powered': solved_with_quantum
             }
             
             return result
@@ -210,7 +302,9 @@ class QuantumWorkflowOptimizer:
     
     def _create_qubo(self, budget: float, deadline: float, 
                     developers: List[Dict[str, Any]], 
-                    projects: List[Dict[str, Any]]) -> QuadraticProgram:
+                    projects: List[Dict[str, Any]],
+                    skill_match: tuple = None,
+                    arrays: ProblemArrays = None) -> 'QuadraticProgram':
         """
         Create a QUBO (Quadratic Unconstrained Binary Optimization) formulation of the problem
         
@@ -219,102 +313,157 @@ class QuantumWorkflowOptimizer:
             deadline: Project deadline
             developers: List of developers
             projects: List of projects in execution order
+            skill_match: Result of _skill_match_ratios for these developers and
+                projects; computed here if not given
+            arrays: Result of _problem_arrays for these developers, projects
+                and deadline; computed here if not given
             
         Returns:
             QuadraticProgram object representing the QUBO problem
         """
+        _ensure_qiskit()
+        
+        if skill_match is None:
+            skill_match = _skill_match_ratios(developers, projects)
+        if arrays is None:
+            arrays = _problem_arrays(developers, projects, deadline)
+        
         # Create a new quadratic program
         qubo = QuadraticProgram(name="Workflow Optimization")
         
-        # Create binary variables for each developer-project assignment
-        # x_{i,j} = 1 if developer i is assigned to project j, 0 otherwise
-        for i, dev in enumerate(developers):
-            for j, proj in enumerate(projects):
-                qubo.binary_var(name=f"x_{i}_{j}")
+        # Every variable costs a qubit, so pairs that can never be chosen are
+        # eliminated up front: a project longer than a developer's whole
+        # capacity can't go to that developer
+        hours = arrays.hours.tolist()
+        capacities = arrays.capacities.tolist()
+        fits = _fitting_pairs(arrays)
+        
+        # Create binary variables for each feasible developer-project assignment
+        # x_{i,j} = 1 if developer i is assigned to project j, 0 otherwise.
+        # They are declared developer-major in a single call where supported,
+        # and their names are formatted once and reused below.
+        fit_pairs = np.argwhere(fits).tolist()
+        keys = [f"{i}_{j}" for i, j in fit_pairs]
+        if hasattr(qubo, 'binary_var_list'):
+            qubo.binary_var_list(keys, name="x_")
+        else:
+            for key in keys:
+                qubo.binary_var(name=f"x_{key}")
+        var_name_of = {(i, j): f"x_{key}" for (i, j), key in zip(fit_pairs, keys)}
         
         # Calculate coefficients for the objective function
-        # We want to minimize a weighted sum of:
-        # 1. Cost (weighted by budget)
-        # 2. Time (weighted by deadline)
-        # 3. Skill mismatch (weighted by project priority)
+        total_coef = _objective_matrix(budget, deadline, arrays, skill_match)
         
         # Initialize linear and quadratic terms
         linear_terms = {}
         quadratic_terms = {}
         
-        # Create constraints and objective function
-        for j, proj in enumerate(projects):
-            # Each project must be assigned to exactly one developer
-            constraint_expr = 0
-            for i, dev in enumerate(developers):
-                var_name = f"x_{i}_{j}"
-                constraint_expr += qubo.get_variable(var_name)
-                
-                # Calculate cost coefficient (higher cost = higher coefficient since we're minimizing)
-                cost_coef = dev['rate'] * proj['hours'] / budget
-                
-                # Calculate time coefficient
-                time_coef = proj['hours'] / (dev['hours_per_day'] * deadline)
-                
-                # Calculate skill match coefficient (lower match = higher coefficient)
-                skill_match = 0
-                if 'skills' in dev and 'required_skills' in proj and proj['required_skills']:
-                    matched_skills = set(s.lower() for s in dev['skills']) & set(s.lower() for s in proj['required_skills'])
-                    skill_match = len(matched_skills) / len(proj['required_skills']) if proj['required_skills'] else 1
-                skill_mismatch_coef = (1 - skill_match) * proj.get('priority', 3) / 5
-                
-                # Combined coefficient with weighted factors
-                total_coef = 0.5 * cost_coef + 0.3 * time_coef + 0.2 * skill_mismatch_coef
-                linear_terms[var_name] = total_coef
-            
-            # Add constraint: each project must be assigned to exactly one developer
-            qubo.linear_constraint(linear=constraint_expr, sense='==', rhs=1, name=f"proj_{j}_assignment")
+        # Objective terms of the feasible assignments, grouped by project
+        project_vars = [[] for _ in projects]
+        for (i, j), coef in zip(fit_pairs, total_coef[fits].tolist()):
+            var_name = var_name_of[(i, j)]
+            linear_terms[var_name] = coef
+            project_vars[j].append(var_name)
         
-        # Add constraint: a developer can't be assigned more work than they can handle
+        # Each project must be assigned to exactly one developer. Rather than
+        # leaving the solver to penalize these equalities with its default
+        # weight, fold lam * (sum_i x_ij - 1)^2 into the objective with
+        # lam = 2 * max |coefficient|, so leaving a project unassigned or
+        # double-assigning it always costs more than any single assignment
+        # saves. With x^2 = x on binaries the square expands to
+        # lam * (1 - sum_i x_ij + 2 * sum_{i<k} x_ij x_kj).
+        penalty = 2 * max((abs(coef) for coef in linear_terms.values()), default=0.0)
+        constant = 0.0
+        for var_names in project_vars:
+            constant += penalty
+            for n, var_name in enumerate(var_names):
+                linear_terms[var_name] -= penalty
+                for other_name in var_names[n + 1:]:
+                    quadratic_terms[(var_name, other_name)] = 2 * penalty
+        
+        # Add constraint: a developer can't be assigned more work than they can handle.
+        # It is skipped when all projects that fit can't exceed the capacity together,
+        # which also saves the slack qubits the solver would add for the inequality.
         for i, dev in enumerate(developers):
-            dev_capacity = dev['hours_per_day'] * deadline
+            dev_capacity = capacities[i]
+            feasible = np.flatnonzero(fits[i]).tolist()
+            if sum(hours[j] for j in feasible) <= dev_capacity:
+                continue
             expr = 0
-            for j, proj in enumerate(projects):
-                expr += proj['hours'] * qubo.get_variable(f"x_{i}_{j}")
+            for j in feasible:
+                expr += hours[j] * qubo.get_variable(var_name_of[(i, j)])
             qubo.linear_constraint(linear=expr, sense='<=', rhs=dev_capacity, name=f"dev_{i}_capacity")
         
         # Set the objective function
-        qubo.minimize(linear=linear_terms, quadratic=quadratic_terms)
+        qubo.minimize(constant=constant, linear=linear_terms, quadratic=quadratic_terms)
         
         return qubo
     
-    def _solve_with_quantum(self, qubo: QuadraticProgram) -> Dict[str, Any]:
+    def _cached_solution(self, cache_key: tuple) -> Optional[Dict[str, Any]]:
+        """
+        Look up the solution _solve_with_quantum stored for an identical QUBO
+        
+        Args:
+            cache_key: Key from _qubo_cache_key
+            
+        Returns:
+            Dictionary with the cached solution, or None if there is none
+        """
+        with self._solution_cache_lock:
+            cached = self._solution_cache.get(cache_key)
+            if cached is None:
+                return None
+            self._solution_cache.move_to_end(cache_key)
+        logger.info("Reusing cached QAOA solution for identical QUBO")
+        return {'x': list(cached), 'success': True}
+    
+    def _solve_with_quantum(self, qubo: 'QuadraticProgram', cache_key: tuple = None,
+                            fits: np.ndarray = None) -> Dict[str, Any]:
         """
         Solve the QUBO problem using QAOA (Quantum Approximate Optimization Algorithm)
         
         Args:
             qubo: The quadratic program to solve
+            cache_key: Key from _qubo_cache_key; successful solutions are
+                remembered under it for _cached_solution
+            fits: Result of _fitting_pairs used when building the QUBO; if
+                given, a solution that _decode_solution rejects is reported
+                as unsuccessful and not cached
             
         Returns:
             Dictionary with solution
         """
-        # Set up the quantum backend (simulator or real quantum hardware)
-        if self.use_quantum and hasattr(self, 'ibm_quantum_provider'):
-            # Use IBM Quantum hardware
-            try:
-                backend = self.ibm_quantum_provider.get_backend('ibmq_qasm_simulator')
-            except:
-                backend = Aer.get_backend('qasm_simulator')
-        else:
-            # Use local simulator
-            backend = Aer.get_backend('qasm_simulator')
-        
-        # Create QAOA instance
-        sampler = Sampler()
-        qaoa = QAOA(sampler=sampler, optimizer=COBYLA(), reps=2)
+        _ensure_qiskit()
         
-        # Relax the QUBO and create a quantum instance
-        # Use MinimumEigenOptimizer to convert QUBO to Ising Hamiltonian
-        optimizer = MinimumEigenOptimizer(qaoa)
+        with self._solver_lock:
+            eigen_optimizer = self._get_eigen_optimizer()
         
         try:
-            # Solve the problem
-            result = optimizer.solve(qubo)
+            # Solve the problem; the shared solver stack is used by one solve at a time
+            with self._solver_lock:
+                # QAOA has 2 * reps angles whatever the problem size, so the previous
+                # optimum is a valid (and usually close) starting point
+                if self._last_params is not None:
+                    self._qaoa.initial_point = self._last_params
+                result = eigen_optimizer.solve(qubo)
+                eigen_result = getattr(result, 'min_eigen_solver_result', None)
+                optimal_point = getattr(eigen_result, 'optimal_point', None)
+                if optimal_point is not None:
+                    self._last_params = optimal_point
+            
+            if fits is not None and _decode_solution(result.x, fits) is None:
+                logger.warning("Quantum solver returned an invalid assignment")
+                return {
+                    'x': result.x,
+                    'variables': qubo.variables,
+                    'success': False
+                }
+            
+            if cache_key is not None:
+                with self._solution_cache_lock:
+                    self._solution_cache[cache_key] = tuple(result.x)
+                    if len(self._solution_cache) > QAOA_CACHE_SIZE:
+                        self._solution_cache.popitem(last=False)
             return {
                 'x': result.x,
                 'variables': qubo.variables,
@@ -329,9 +478,35 @@ class QuantumWorkflowOptimizer:
                 'success': False
             }
     
+    def _get_eigen_optimizer(self):
+        """
+        Return the QAOA-based MinimumEigenOptimizer, creating it on first use
+        
+        Callers must hold self._solver_lock.
+        
+        Returns:
+            MinimumEigenOptimizer shared by all solves of this optimizer
+        """
+        if self._eigen_optimizer is None:
+            # Create QAOA instance; SPSA copes with shot noise and avoids the
+            # crashes and hangs COBYLA can hit on larger parameter sets. The
+            # reference Sampler simulates locally and takes no backend, so
+            # none is looked up.
+            sampler = Sampler()
+            qaoa_optimizer = SPSA(maxiter=SPSA_MAXITER) if SPSA is not None else COBYLA()
+            self._qaoa = QAOA(sampler=sampler, optimizer=qaoa_optimizer, reps=2)
+            
+            # Relax the QUBO and create a quantum instance
+            # Use MinimumEigenOptimizer to convert QUBO to Ising Hamiltonian
+            self._eigen_optimizer = MinimumEigenOptimizer(self._qaoa)
+        return self._eigen_optimizer
+    
     def _process_results(self, result: Dict[str, Any], 
                         developers: List[Dict[str, Any]], 
-                        projects: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+                        projects: List[Dict[str, Any]],
+                        skill_match_pct: np.ndarray = None,
+                        fits: np.ndarray = None,
+                        arrays: ProblemArrays = None) -> List[Dict[str, Any]]:
         """
         Process optimization results and create assignments
         
@@ -339,120 +514,402 @@ class QuantumWorkflowOptimizer:
             result: Optimization result from QAOA
             developers: List of developers
             projects: List of projects
+            skill_match_pct: Result of _skill_match_percent for these developers
+                and projects; computed here if not given
+            fits: Result of _fitting_pairs used when building the QUBO; every
+                pair has a variable if not given
+            arrays: ProblemArrays of these developers and projects; computed
+                here if not given
             
         Returns:
             List of assignment dictionaries
         """
         assignments = []
         
+        # Skill match percentages; 100 where there are no skills to compare
+        if skill_match_pct is None:
+            skill_match_pct = _skill_match_percent(_skill_match_ratios(developers, projects))
+        
+        # Only trust x if it assigns every project exactly once
+        chosen = None
+        if result.get('success', False):
+            if fits is None:
+                fits = np.ones((len(developers), len(projects)), dtype=bool)
+            chosen = _decode_solution(result['x'], fits)
+            if chosen is None:
+                logger.warning("Discarding invalid quantum solution; using greedy assignment")
+        
         # If quantum optimization wasn't successful, fall back to greedy assignment
-        if not result.get('success', False):
-            # Simple greedy assignment
-            used_devs = set()
+        if chosen is None:
+            # Simple greedy assignment over a precomputed score matrix
+            # (lower is better): cost + time * 10 + skill mismatch
+            if arrays is None:
+                arrays = _problem_arrays(developers, projects, 0)  # Capacities aren't needed here
+            rates, hours_per_day, _, hours, _ = arrays
+            scores = (rates[:, None] * hours[None, :]
+                      + hours[None, :] / hours_per_day[:, None] * 10
+                      + (100 - skill_match_pct))
+            
+            # Each developer takes at most one project; developers sharing a
+            # name count as the same person
+            name_ids = {}
+            name_group = np.array([name_ids.setdefault(d['name'], len(name_ids)) for d in developers], dtype=np.int64)
+            used = np.zeros(len(developers), dtype=bool)
+            
             for j, proj in enumerate(projects):
-                # Find best available developer
-                best_dev = None
-                best_score = float('inf')
+                # Find best available developer (first one on ties)
+                column = np.where(used, np.inf, scores[:, j])
+                best_i = int(np.argmin(column)) if len(column) else 0
+                if not len(column) or column[best_i] == np.inf:
+                    continue
                 
-                for i, dev in enumerate(developers):
-                    if dev['name'] in used_devs:
-                        continue
-                        
-                    # Calculate a simple score (lower is better)
-                    cost = dev['rate'] * proj['hours']
-                    time = proj['hours'] / dev['hours_per_day']
-                    
-                    # Calculate skill match
-                    skill_match = 100
-                    if 'required_skills' in proj and proj['required_skills'] and 'skills' in dev:
-                        matched_skills = set(s.lower() for s in dev['skills']) & set(s.lower() for s in proj['required_skills'])
-                        skill_match = int(len(matched_skills) / len(proj['required_skills']) * 100) if proj['required_skills'] else 100
-                    
-                    # Combined score (lower is better)
-                    score = cost + time * 10 + (100 - skill_match)
-                    
-                    if score < best_score:
-                        best_score = score
-                        best_dev = dev
+                best_dev = developers[best_i]
+                used |= name_group == name_group[best_i]
+                cost = best_dev['rate'] * proj['hours']
                 
-                if best_dev:
-                    used_devs.add(best_dev['name'])
-                    cost = best_dev['rate'] * proj['hours']
-                    
-                    # Calculate final skill match for this developer-project pair
-                    final_skill_match = 100
-                    if 'required_skills' in proj and proj['required_skills'] and 'skills' in best_dev:
-                        matched_skills = set(s.lower() for s in best_dev['skills']) & set(s.lower() for s in proj['required_skills'])
-                        final_skill_match = int(len(matched_skills) / len(proj['required_skills']) * 100) if proj['required_skills'] else 100
-                    
-                    assignments.append({
-                        'developer': best_dev['name'],
-                        'project': proj['name'],
-                        'hours': proj['hours'],
-                        'cost': cost,
-                        'skill_match': final_skill_match
-                    })
+                # Final skill match for this developer-project pair
+                final_skill_match = int(skill_match_pct[best_i, j])
+                
+                assignments.append({
+                    'developer': best_dev['name'],
+                    'project': proj['name'],
+                    'hours': proj['hours'],
+                    'cost': cost,
+                    'skill_match': final_skill_match
+                })
         else:
-            # Process quantum results
-            # x is a binary array where 1 indicates an assignment
-            x = result['x']
-            vars_dict = {var.name: idx for idx, var in enumerate(result['variables'])}
+            # Process quantum results: extract assignments from the
+            # (developer, project) pairs whose variable is 1 in x
+            pairs = [tuple(pair) for pair in chosen.tolist()]
+            assignments = self._build_assignments(pairs, developers, projects, skill_match_pct)
+        
+        return assignments
+    
+    def _build_assignments(self, pairs: List[tuple], 
+                          developers: List[Dict[str, Any]], 
+                          projects: List[Dict[str, Any]],
+                          skill_match_pct: np.ndarray) -> List[Dict[str, Any]]:
+        """
+        Create assignments from solved developer-project index pairs
+        
+        Args:
+            pairs: List of (developer index, project index) tuples
+            developers: List of developers
+            projects: List of projects
+            skill_match_pct: Result of _skill_match_percent for these developers and projects
             
-            # Extract assignments from the solution
-            for i, dev in enumerate(developers):
-                for j, proj in enumerate(projects):
-                    var_name = f"x_{i}_{j}"
-                    if var_name in vars_dict and x[vars_dict[var_name]] == 1:
-                        # This developer is assigned to this project
-                        cost = dev['rate'] * proj['hours']
-                        
-                        # Calculate skill match
-                        skill_match = 100
-                        if 'required_skills' in proj and proj['required_skills'] and 'skills' in dev:
-                            matched_skills = set(s.lower() for s in dev['skills']) & set(s.lower() for s in proj['required_skills'])
-                            skill_match = int(len(matched_skills) / len(proj['required_skills']) * 100) if proj['required_skills'] else 100
-                        
-                        assignments.append({
-                            'developer': dev['name'],
-                            'project': proj['name'],
-                            'hours': proj['hours'],
-                            'cost': cost,
-                            'skill_match': skill_match
-                        })
+        Returns:
+            List of assignment dictionaries
+        """
+        assignments = []
+        for i, j in pairs:
+            dev = developers[i]
+            proj = projects[j]
+            assignments.append({
+                'developer': dev['name'],
+                'project': proj['name'],
+                'hours': proj['hours'],
+                'cost': dev['rate'] * proj['hours'],
+                'skill_match': int(skill_match_pct[i, j])
+            })
         
         return assignments
     
     def _calculate_metrics(self, assignments: List[Dict[str, Any]], 
-                          developers: List[Dict[str, Any]]) -> tuple:
+                          developers: List[Dict[str, Any]],
+                          dev_indices: List[int] = None,
+                          arrays: ProblemArrays = None) -> tuple:
         """
         Calculate metrics from the assignments
         
         Args:
             assignments: List of assignment dictionaries
             developers: List of developer dictionaries
+            dev_indices: Index into developers of each assignment's developer;
+                looked up by name if not given
+            arrays: ProblemArrays of these developers; daily hours are read
+                from the dictionaries if not given
             
         Returns:
             Tuple of (total_cost, completion_time)
         """
-        total_cost = sum(a['cost'] for a in assignments)
-        
-        # Calculate completion time based on developer workloads
-        dev_workloads = {}
-        for a in assignments:
-            dev_name = a['developer']
-            if dev_name not in dev_workloads:
-                dev_workloads[dev_name] = 0
-            dev_workloads[dev_name] += a['hours']
-        
-        # Calculate time for each developer
-        dev_times = {}
-        for dev_name, hours in dev_workloads.items():
-            # Find the developer in the list
-            dev = next((d for d in developers if d['name'] == dev_name), None)
-            if dev:
-                dev_times[dev_name] = hours / dev['hours_per_day']
-        
-        # Max time is the completion time
-        completion_time = max(dev_times.values()) if dev_times else 0
+        count = len(assignments)
+        costs = np.fromiter((a['cost'] for a in assignments), dtype=np.float64, count=count)
+        hours = np.fromiter((a['hours'] for a in assignments), dtype=np.float64, count=count)
+        total_cost = float(costs.sum())
+        
+        # Developers sharing a name are one person, timed by the first of them
+        first_of_name = {}
+        owner_of = np.fromiter(
+            (first_of_name.setdefault(d['name'], i) for i, d in enumerate(developers)),
+            dtype=np.int64, count=len(developers)
+        )
+        if dev_indices is None:
+            owners = np.fromiter((first_of_name.get(a['developer'], -1) for a in assignments),
+                                 dtype=np.int64, count=count)
+        else:
+            owners = owner_of[np.asarray(dev_indices, dtype=np.int64)]
+        known = owners >= 0
+        owners = owners[known]
+        
+        # Workload of each developer, in days; the max is the completion time
+        workloads = np.bincount(owners, weights=hours[known], minlength=len(developers))
+        busy = np.bincount(owners, minlength=len(developers)) > 0
+        if arrays is not None:
+            hours_per_day = arrays.hours_per_day
+        else:
+            hours_per_day = np.fromiter((d['hours_per_day'] for d in developers), dtype=np.float64, count=len(developers))
+        completion_time = float((workloads[busy] / hours_per_day[busy]).max(initial=0.0))
         
         return total_cost, completion_time
+
+def _problem_arrays(developers: List[Dict[str, Any]], 
+                    projects: List[Dict[str, Any]],
+                    deadline: float) -> ProblemArrays:
+    """
+    Extract the numeric developer and project fields into float arrays
+    
+    Args:
+        developers: List of developers
+        projects: List of projects
+        deadline: Project deadline in days
+        
+    Returns:
+        ProblemArrays for these developers and projects
+    """
+    rates = np.fromiter((d['rate'] for d in developers), dtype=np.float64, count=len(developers))
+    hours_per_day = np.fromiter((d['hours_per_day'] for d in developers), dtype=np.float64, count=len(developers))
+    hours = np.fromiter((p['hours'] for p in projects), dtype=np.float64, count=len(projects))
+    priorities = np.fromiter((p.get('priority', 3) for p in projects), dtype=np.float64, count=len(projects))
+    return ProblemArrays(rates, hours_per_day, hours_per_day * deadline, hours, priorities)
+
+def _skill_match_ratios(developers: List[Dict[str, Any]], 
+                        projects: List[Dict[str, Any]]) -> tuple:
+    """
+    Compute the fraction of each project's required skills each developer has
+    
+    Every lowercased skill is interned as one bit, so each developer's skills
+    and each project's required skills become an int bitmask and a pair's
+    matched skill count is a single AND and popcount.
+    
+    Args:
+        developers: List of developers
+        projects: List of projects
+        
+    Returns:
+        Tuple of (developer x project match ratio matrix, developer x project
+        boolean matrix marking pairs that have skills to compare); ratios are
+        0 where there is nothing to compare
+    """
+    skill_bits = {}
+    raw_bits = {}  # Bit of each skill string as given, so each is lowercased once
+    
+    def to_mask(skills):
+        mask = 0
+        for skill in skills:
+            bit = raw_bits.get(skill)
+            if bit is None:
+                bit = raw_bits[skill] = skill_bits.setdefault(skill.lower(), 1 << len(skill_bits))
+            mask |= bit
+        return mask
+    
+    # Developers without a skills list and projects without required skills
+    # have nothing to compare
+    dev_masks = [(i, to_mask(dev['skills'])) for i, dev in enumerate(developers) if 'skills' in dev]
+    proj_masks = [(j, to_mask(proj['required_skills']), len(proj['required_skills']))
+                  for j, proj in enumerate(projects) if proj.get('required_skills')]
+    
+    ratios = np.zeros((len(developers), len(projects)), dtype=np.float64)
+    comparable = np.zeros((len(developers), len(projects)), dtype=bool)
+    for i, dev_mask in dev_masks:
+        for j, req_mask, req_count in proj_masks:
+            ratios[i, j] = (dev_mask & req_mask).bit_count() / req_count
+            comparable[i, j] = True
+    
+    return ratios, comparable
+
+def _skill_match_percent(skill_match: tuple) -> np.ndarray:
+    """
+    Convert match ratios to the whole percentages reported on assignments
+    
+    Args:
+        skill_match: Result of _skill_match_ratios
+        
+    Returns:
+        Developer x project int matrix; truncated percentages, and 100 where
+        there are no skills to compare
+    """
+    ratios, comparable = skill_match
+    return np.where(comparable, (ratios * 100).astype(np.int64), 100)
+
+def _fitting_pairs(arrays: ProblemArrays) -> np.ndarray:
+    """
+    Mark the developer-project pairs where the project fits the developer's capacity
+    
+    Args:
+        arrays: ProblemArrays of the developers and projects
+        
+    Returns:
+        Developer x project boolean matrix
+    """
+    return arrays.hours[None, :] <= arrays.capacities[:, None]
+
+def _decode_solution(x, fits: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Map a QUBO solution vector to the (developer, project) pairs it selects
+    
+    _create_qubo declares one variable per fitting pair, developer-major, so
+    the k-th variable is the k-th fitting (developer, project) pair.
+    
+    Args:
+        x: Solution vector, one 0/1 entry per QUBO variable
+        fits: Result of _fitting_pairs used when building the QUBO
+        
+    Returns:
+        Chosen index pairs as a k x 2 array, or None if x doesn't match the
+        variable layout or doesn't assign every project exactly once
+    """
+    layout = np.argwhere(fits)
+    x = np.asarray(x)
+    if x.shape != (len(layout),):
+        return None
+    chosen = layout[x == 1]
+    if not (np.bincount(chosen[:, 1], minlength=fits.shape[1]) == 1).all():
+        return None
+    return chosen
+
+def _objective_matrix(budget: float, deadline: float, 
+                      arrays: ProblemArrays,
+                      skill_match: tuple) -> np.ndarray:
+    """
+    Compute the objective coefficient of every developer-project assignment
+    
+    We want to minimize a weighted sum of:
+    1. Cost (weighted by budget)
+    2. Time (weighted by deadline)
+    3. Skill mismatch (weighted by project priority)
+    Each factor is a developer x project matrix built by broadcasting.
+    
+    Args:
+        budget: Total available budget
+        deadline: Project deadline
+        arrays: ProblemArrays of the developers and projects
+        skill_match: Result of _skill_match_ratios for the same developers
+            and projects
+        
+    Returns:
+        Developer x project coefficient matrix
+    """
+    rates, hours_per_day, _, hours, priorities = arrays
+    
+    # Cost coefficient (higher cost = higher coefficient since we're minimizing)
+    cost_coef = rates[:, None] * hours[None, :] / budget
+    
+    # Time coefficient
+    time_coef = hours[None, :] / (hours_per_day[:, None] * deadline)
+    
+    # Skill match coefficient (lower match = higher coefficient); pairs
+    # without skills to compare count as no match
+    skill_mismatch_coef = (1 - skill_match[0]) * priorities[None, :] / 5
+    
+    # Combined coefficient with weighted factors
+    return 0.5 * cost_coef + 0.3 * time_coef + 0.2 * skill_mismatch_coef
+
+def _solve_linear_assignment(costs: np.ndarray, arrays: ProblemArrays) -> List[tuple]:
+    """
+    Solve the assignment objective exactly with the Hungarian algorithm
+    
+    Each developer is given as many rows as the number of projects that could
+    fit in their capacity (smallest projects first), so one developer can take
+    several projects. The solution is only returned if it also respects every
+    developer's total capacity.
+    
+    Args:
+        costs: Developer x project objective coefficients
+        arrays: ProblemArrays of the developers and projects
+        
+    Returns:
+        List of (developer index, project index) pairs in project order, or
+        None if no capacity-respecting solution was found
+    """
+    hours = arrays.hours
+    capacity = arrays.capacities
+    num_developers, num_projects = costs.shape
+    
+    # Projects that don't fit a developer at all are priced out of reach
+    fits = hours[None, :] <= capacity[:, None]
+    if not fits.any(axis=0).all():
+        return None
+    
+    slots = np.minimum(np.searchsorted(np.cumsum(np.sort(hours)), capacity, side='right'), num_projects)
+    rows = np.repeat(np.arange(num_developers), slots)
+    if len(rows) < num_projects:
+        return None
+    
+    penalty = np.abs(costs).sum() + 1
+    row_ind, col_ind = linear_sum_assignment(np.where(fits, costs, penalty)[rows])
+    dev_ind = rows[row_ind]
+    
+    load = np.bincount(dev_ind, weights=hours[col_ind], minlength=num_developers)
+    if not fits[dev_ind, col_ind].all() or (load > capacity).any():
+        return None
+    
+    order = np.argsort(col_ind)
+    return list(zip(dev_ind[order].tolist(), col_ind[order].tolist()))
+
+def _solve_exhaustive(costs: np.ndarray, arrays: ProblemArrays) -> List[tuple]:
+    """
+    Find the cheapest capacity-respecting assignment by enumerating all of them
+    
+    Only meant for small problems (see EXHAUSTIVE_MAX_PAIRS): with n
+    developer-project pairs there are at most a few hundred combinations.
+    
+    Args:
+        costs: Developer x project objective coefficients
+        arrays: ProblemArrays of the developers and projects
+        
+    Returns:
+        List of (developer index, project index) pairs in project order, or
+        None if no assignment respects every developer's capacity
+    """
+    hours = arrays.hours.tolist()
+    capacities = arrays.capacities.tolist()
+    columns = costs.T.tolist()
+    
+    # Candidate developers of each project: those it fits on its own
+    candidates = [[i for i, capacity in enumerate(capacities) if h <= capacity] for h in hours]
+    
+    best_choice = None
+    best_cost = float('inf')
+    for choice in itertools.product(*candidates):
+        cost = sum(column[i] for column, i in zip(columns, choice))
+        if cost >= best_cost:
+            continue
+        load = [0] * len(capacities)
+        for i, h in zip(choice, hours):
+            load[i] += h
+        if all(l <= capacity for l, capacity in zip(load, capacities)):
+            best_choice = choice
+            best_cost = cost
+    
+    if best_choice is None:
+        return None
+    return [(i, j) for j, i in enumerate(best_choice)]
+
+def _qubo_cache_key(costs: np.ndarray, arrays: ProblemArrays) -> tuple:
+    """
+    Build a hashable key from everything _create_qubo puts into the QUBO
+    
+    Args:
+        costs: Developer x project objective coefficients
+        arrays: ProblemArrays of the developers and projects
+        
+    Returns:
+        Tuple of the coefficient matrix, project hours and developer capacities
+    """
+    return (
+        costs.shape,
+        costs.tobytes(),
+        arrays.hours.tobytes(),
+        arrays.capacities.tobytes()
+    )
@@ -4,11 +4,24 @@ Quantum Algorithm Simulation Playground
 This module provides a flexible environment for simulating quantum algorithms
 using Qiskit, allowing users to experiment with quantum circuits and visualize results.
 """
+import array
+import hashlib
 import json
 import logging
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 import numpy as np
 from typing import Dict, List, Any, Optional, Union
 
+# orjson encodes in native code; fall back to the stdlib encoder when it is
+# not installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Import Qiskit modules
 try:
     from qiskit import QuantumCircuit, Aer, transpile, assemble
@@ -22,57 +35,88 @@ except ImportError:
     QISKIT_AVAILABLE = False
     # Provide fallback for systems without Qiskit
     class FallbackQuantumCircuit:
+        """
+        Gate-list circuit stand-in
+        
+        Gates are stored column-wise: a name list and parallel arrays of the
+        first and second qubit (or clbit for measure) and the rotation angle,
+        with -1 and 0.0 for unused operands. A barrier with first qubit -1
+        spans all qubits.
+        """
         def __init__(self, num_qubits, num_clbits=None, name=None):
             self.num_qubits = num_qubits
             self.num_clbits = num_clbits or num_qubits
             self.name = name or "fallback_circuit"
-            self.gates = []
+            self.gate_names = []
+            self._qa = array.array('h')
+            self._qb = array.array('h')
+            self._params = array.array('d')
             
-        def h(self, qubit):
-            self.gates.append(("h", qubit))
+        def _append(self, name, qa=-1, qb=-1, param=0.0):
+            self.gate_names.append(name)
+            self._qa.append(qa)
+            self._qb.append(qb)
+            self._params.append(param)
             return self
             
+        def h(self, qubit):
+            return self._append("h", qubit)
+            
         def cx(self, control, target):
-            self.gates.append(("cx", control, target))
-            return self
+            return self._append("cx", control, target)
             
         def measure_all(self):
-            self.gates.append(("measure_all",))
-            return self
+            return self._append("measure_all")
             
         def x(self, qubit):
-            self.gates.append(("x", qubit))
-            return self
+            return self._append("x", qubit)
             
         def y(self, qubit):
-            self.gates.append(("y", qubit))
-            return self
+            return self._append("y", qubit)
             
         def z(self, qubit):
-            self.gates.append(("z", qubit))
-            return self
+            return self._append("z", qubit)
             
         def rx(self, theta, qubit):
-            self.gates.append(("rx", theta, qubit))
-            return self
+            return self._append("rx", qubit, param=theta)
             
         def ry(self, theta, qubit):
-            self.gates.append(("ry", theta, qubit))
-            return self
+            return self._append("ry", qubit, param=theta)
             
         def rz(self, theta, qubit):
-            self.gates.append(("rz", theta, qubit))
-            return self
+            return self._append("rz", qubit, param=theta)
             
         def barrier(self, *qubits):
             if not qubits:
                 qubits = range(self.num_qubits)
-            self.gates.append(("barrier", list(qubits)))
-            return self
+            if len(qubits) > 2:
+                return self._append("barrier")  # Wider barriers span all qubits
+            return self._append("barrier", *qubits)
             
         def measure(self, qubit, clbit):
-            self.gates.append(("measure", qubit, clbit))
-            return self
+            return self._append("measure", qubit, clbit)
+            
+        def gate_rows(self):
+            """(name, first qubit, second qubit or clbit, angle) of each gate"""
+            return zip(self.gate_names, self._qa, self._qb, self._params)
+            
+        @property
+        def gates(self):
+            """Gates as tuples, e.g. ("rx", theta, qubit) or ("cx", control, target)"""
+            gates = []
+            for name, qa, qb, param in self.gate_rows():
+                if name == "measure_all":
+                    gates.append((name,))
+                elif name in ("rx", "ry", "rz"):
+                    gates.append((name, param, qa))
+                elif name == "barrier":
+                    qubits = list(range(self.num_qubits)) if qa < 0 else [qa] if qb < 0 else [qa, qb]
+                    gates.append((name, qubits))
+                elif name in ("cx", "measure"):
+                    gates.append((name, qa, qb))
+                else:
+                    gates.append((name, qa))
+            return gates
             
         def draw(self, **kwargs):
             circuit_str = f"Circuit: {self.name} with {self.num_qubits} qubits\n"
@@ -110,21 +154,33 @@ except ImportError:
             if isinstance(circuit, FallbackQuantumCircuit):
                 qubits = circuit.num_qubits
                 # Simple Bell state simulation for 2-qubit systems
-                if qubits == 2 and any(g[0] == "cx" for g in circuit.gates):
+                if qubits == 2 and "cx" in circuit.gate_names:
                     return {'00': 500, '11': 500}
                 # Simple superposition for single H gates
-                elif qubits == 1 and any(g[0] == "h" for g in circuit.gates):
+                elif qubits == 1 and "h" in circuit.gate_names:
                     return {'0': 500, '1': 500}
                 # Default pattern
                 else:
-                    result = {}
-                    for i in range(2**qubits):
-                        bitstring = format(i, f'0{qubits}b')
-                        # More complex circuits tend toward uniform distribution
-                        result[bitstring] = 1024 // (2**qubits)
-                    return result
+                    # More complex circuits tend toward uniform distribution
+                    return dict.fromkeys(_bitstrings(qubits), 1024 // (2**qubits))
             return {'0': 1024}  # Default fallback
             
+    def _bitstrings(num_qubits):
+        """
+        All num_qubits-bit strings in ascending order
+        
+        Widths up to the create_circuit cap of 12 qubits are built once and
+        cached; wider circuits can only come from submitted circuit data and
+        are built on every call rather than pinned in memory.
+        """
+        if num_qubits <= 12:
+            return _cached_bitstrings(num_qubits)
+        return tuple(format(i, f'0{num_qubits}b') for i in range(2**num_qubits))
+    
+    @lru_cache(maxsize=None)
+    def _cached_bitstrings(num_qubits):
+        return tuple(format(i, f'0{num_qubits}b') for i in range(2**num_qubits))
+    
     Aer = FallbackAer
     
     def transpile(*args, **kwargs):
@@ -134,12 +190,76 @@ except ImportError:
         return args[0]
         
     def plot_histogram(counts):
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(counts, option=orjson.OPT_INDENT_2).decode()
         return json.dumps(counts, indent=2)
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Single-qubit gates drawn by random circuits
+_SINGLE_QUBIT_GATES = ('h', 'x', 'y', 'z', 'rx', 'ry', 'rz')
+
+# Gate names of serialized circuits; each gate is stored as its index here
+_GATE_NAMES = ('h', 'x', 'y', 'z', 'rx', 'ry', 'rz', 'cx', 'barrier', 'measure', 'measure_all')
+_GATE_CODES = {name: code for code, name in enumerate(_GATE_NAMES)}
+
+def _rx_matrix(theta: float) -> np.ndarray:
+    c, s = np.cos(theta / 2), np.sin(theta / 2)
+    return np.array([[c, -1j * s], [-1j * s, c]])
+
+def _ry_matrix(theta: float) -> np.ndarray:
+    c, s = np.cos(theta / 2), np.sin(theta / 2)
+    return np.array([[c, -s], [s, c]], dtype=complex)
+
+def _rz_matrix(theta: float) -> np.ndarray:
+    return np.diag([np.exp(-0.5j * theta), np.exp(0.5j * theta)])
+
+_H_MATRIX = np.array([[1, 1], [1, -1]], dtype=complex) / np.sqrt(2)
+_X_MATRIX = np.array([[0, 1], [1, 0]], dtype=complex)
+_Y_MATRIX = np.array([[0, -1j], [1j, 0]])
+_Z_MATRIX = np.array([[1, 0], [0, -1]], dtype=complex)
+
+# Gate code -> function(param) returning the gate's 2x2 unitary, for every
+# single-qubit gate; used to fuse runs of them
+_SINGLE_QUBIT_MATRICES = {
+    _GATE_CODES['h']: lambda theta: _H_MATRIX,
+    _GATE_CODES['x']: lambda theta: _X_MATRIX,
+    _GATE_CODES['y']: lambda theta: _Y_MATRIX,
+    _GATE_CODES['z']: lambda theta: _Z_MATRIX,
+    _GATE_CODES['rx']: _rx_matrix,
+    _GATE_CODES['ry']: _ry_matrix,
+    _GATE_CODES['rz']: _rz_matrix,
+}
+
+# Controlled-phase angles of the QFT, pi / 2**k, indexed by qubit distance k
+_QFT_ANGLES = (np.pi / 2.0 ** np.arange(16)).tolist()
+
+def _instructions(circuit):
+    """Yield (operation, qubit indices, clbit indices) of a Qiskit circuit"""
+    find_bit = circuit.find_bit
+    for instruction in circuit.data:
+        yield (instruction.operation,
+               [find_bit(q).index for q in instruction.qubits],
+               [find_bit(c).index for c in instruction.clbits])
+
+def _legacy_instructions(circuit):
+    """_instructions for Qiskit versions whose circuit.data holds (op, qargs, cargs) tuples"""
+    for instruction, qargs, cargs in circuit.data:
+        yield instruction, [q.index for q in qargs], [c.index for c in cargs]
+
+# Pick the extractor matching the installed Qiskit's circuit.data layout once
+if QISKIT_AVAILABLE:
+    _probe_circuit = QuantumCircuit(1)
+    _probe_circuit.h(0)
+    _circuit_instructions = _instructions if hasattr(_probe_circuit.data[0], 'operation') else _legacy_instructions
+    del _probe_circuit
+
+# Number of transpiled circuits remembered per playground, keyed on the
+# serialized circuit and the backend it was transpiled for
+TRANSPILE_CACHE_SIZE = 128
+
 class QuantumPlayground:
     """
     Quantum Algorithm Simulation Playground
@@ -148,6 +268,23 @@ class QuantumPlayground:
     algorithms, create circuits, and visualize results.
     """
     
+    # Functions(circuit, qubit, second qubit, clbit, param) that replay a
+    # serialized gate, indexed by gate code (see _GATE_NAMES); unused
+    # operands are -1 or 0.0
+    _GATE_DISPATCH = (
+        lambda c, q0, q1, cl, p: c.h(q0),
+        lambda c, q0, q1, cl, p: c.x(q0),
+        lambda c, q0, q1, cl, p: c.y(q0),
+        lambda c, q0, q1, cl, p: c.z(q0),
+        lambda c, q0, q1, cl, p: c.rx(p, q0),
+        lambda c, q0, q1, cl, p: c.ry(p, q0),
+        lambda c, q0, q1, cl, p: c.rz(p, q0),
+        lambda c, q0, q1, cl, p: c.cx(q0, q1),
+        lambda c, q0, q1, cl, p: c.barrier() if q0 < 0 else c.barrier(*((q0,) if q1 < 0 else (q0, q1))),
+        lambda c, q0, q1, cl, p: c.measure(q0, cl),
+        lambda c, q0, q1, cl, p: c.measure_all(),
+    )
+    
     def __init__(self, use_real_quantum=False, ibm_token=None):
         """
         Initialize the quantum playground
@@ -161,6 +298,20 @@ class QuantumPlayground:
         self.backend = None
         self.ibmq_provider = None
         
+        # LRU of transpiled circuits; transpilation dominates repeated runs
+        self._transpile_cache = OrderedDict()
+        self._transpile_cache_lock = threading.Lock()
+        
+        # Fake backends are listed on first use by _load_fake_backends(),
+        # which also maps each fake_<name> to its backend instance
+        self._fake_backends_loaded = True
+        self._fake_backends = {}
+        self._fake_backends_lock = threading.Lock()
+        
+        # One generator for all random circuits instead of seeding a new
+        # one from OS entropy on every call
+        self._rng = np.random.default_rng()
+        
         if QISKIT_AVAILABLE:
             logger.info("Initializing Quantum Playground with Qiskit")
             # Initialize the Aer simulator as default
@@ -184,24 +335,21 @@ class QuantumPlayground:
                     logger.error(f"Failed to connect to IBM Quantum Experience: {str(e)}")
                     # Continue with local simulation only
             else:
-                # Add fake backends for testing
-                try:
-                    fake_provider = FakeProvider()
-                    for backend in fake_provider.backends():
-                        self.available_backends.append(f"fake_{backend.name()}")
-                except Exception:
-                    # Continue without fake backends
-                    pass
+                # Add fake backends for testing, once they are first asked for
+                self._fake_backends_loaded = False
         else:
             logger.warning("Qiskit not available - using fallback simulation")
     
-    def create_circuit(self, num_qubits: int, circuit_type: str = 'empty') -> Dict[str, Any]:
+    def create_circuit(self, num_qubits: int, circuit_type: str = 'empty',
+                       include_drawing: bool = True) -> Dict[str, Any]:
         """
         Create a quantum circuit based on the specified type
         
         Args:
             num_qubits: Number of qubits in the circuit
             circuit_type: Type of circuit to create (empty, bell, ghz, qft, random)
+            include_drawing: Whether to render the text drawing returned as
+                'circuit_drawing'; bulk generation can skip it
             
         Returns:
             Dictionary with circuit information and serialized representation
@@ -231,24 +379,25 @@ class QuantumPlayground:
                     'error': f'Invalid circuit type: {circuit_type}'
                 }
             
-            # Draw the circuit for visualization
-            circuit_drawing = None
-            if QISKIT_AVAILABLE:
-                circuit_drawing = circuit.draw(output='text')
-            else:
-                circuit_drawing = circuit.draw()
-            
             # Create serialized representation of the circuit
             circuit_data = self._serialize_circuit(circuit)
             
-            return {
+            result = {
                 'success': True,
                 'circuit': circuit_data,
                 'num_qubits': num_qubits,
-                'circuit_type': circuit_type,
-                'circuit_drawing': circuit_drawing
+                'circuit_type': circuit_type
             }
             
+            # Draw the circuit for visualization
+            if include_drawing:
+                if QISKIT_AVAILABLE:
+                    result['circuit_drawing'] = circuit.draw(output='text')
+                else:
+                    result['circuit_drawing'] = circuit.draw()
+            
+            return result
+            
         except Exception as e:
             logger.error(f"Error creating circuit: {str(e)}")
             return {
@@ -258,7 +407,8 @@ class QuantumPlayground:
     
     def run_circuit(self, circuit_data: Dict[str, Any], 
                    backend_name: str = 'qasm_simulator',
-                   shots: int = 1024) -> Dict[str, Any]:
+                   shots: int = 1024,
+                   include_figure: bool = False) -> Dict[str, Any]:
         """
         Run a quantum circuit on the specified backend
         
@@ -266,52 +416,26 @@ class QuantumPlayground:
             circuit_data: Serialized circuit data from create_circuit
             backend_name: Name of the backend to use for simulation/execution
             shots: Number of shots (repetitions) for the simulation
+            include_figure: Whether to also render a histogram figure with
+                Qiskit, returned as 'histogram'; rendering is slow, so it is
+                skipped by default
             
         Returns:
             Dictionary with simulation results and visualizations
         """
         try:
-            # Deserialize the circuit
-            circuit = self._deserialize_circuit(circuit_data)
-            if not circuit:
+            # Select the backend
+            backend, backend_name = self._select_backend(backend_name)
+            
+            # Transpile the circuit for the backend, reusing an earlier
+            # transpilation of the same circuit for the same backend
+            transpiled_circuit, = self._get_transpiled([circuit_data], backend, backend_name)
+            if transpiled_circuit is None:
                 return {
                     'success': False,
                     'error': 'Invalid circuit data'
                 }
             
-            # Ensure the circuit has measurements
-            if 'measure_all' not in str(circuit.gates if hasattr(circuit, 'gates') else circuit):
-                circuit.measure_all()
-            
-            # Select the backend
-            if backend_name not in self.available_backends:
-                backend_name = 'qasm_simulator'  # Default to local simulator
-                
-            if backend_name == 'qasm_simulator':
-                backend = Aer.get_backend('qasm_simulator')
-            elif backend_name == 'statevector_simulator':
-                backend = Aer.get_backend('statevector_simulator')
-            elif backend_name.startswith('fake_'):
-                if QISKIT_AVAILABLE:
-                    try:
-                        real_name = backend_name[5:]  # Remove 'fake_' prefix
-                        fake_provider = FakeProvider()
-                        backend = fake_provider.get_backend(real_name)
-                    except:
-                        backend = Aer.get_backend('qasm_simulator')
-                else:
-                    backend = Aer.get_backend('qasm_simulator')
-            elif self.ibmq_provider:
-                try:
-                    backend = self.ibmq_provider.get_backend(backend_name)
-                except:
-                    backend = Aer.get_backend('qasm_simulator')
-            else:
-                backend = Aer.get_backend('qasm_simulator')
-            
-            # Transpile the circuit for the backend
-            transpiled_circuit = transpile(circuit, backend)
-            
             # Run the circuit
             result = backend.run(transpiled_circuit, shots=shots).result()
             
@@ -319,20 +443,10 @@ class QuantumPlayground:
             counts = result.get_counts(transpiled_circuit)
             
             # Generate histogram data
-            if QISKIT_AVAILABLE:
-                try:
-                    # Try to generate a histogram figure
-                    histogram = plot_histogram(counts)
-                    histogram_data = self._convert_histogram_to_data(counts)
-                except:
-                    histogram = None
-                    histogram_data = self._convert_histogram_to_data(counts)
-            else:
-                histogram = None
-                histogram_data = self._convert_histogram_to_data(counts)
+            histogram_data = self._convert_histogram_to_data(counts)
             
             # Prepare the result
-            return {
+            response = {
                 'success': True,
                 'counts': counts,
                 'histogram_data': histogram_data,
@@ -341,6 +455,18 @@ class QuantumPlayground:
                 'quantum_powered': QISKIT_AVAILABLE and self.use_real_quantum,
             }
             
+            if include_figure:
+                histogram = None
+                if QISKIT_AVAILABLE:
+                    try:
+                        # Try to generate a histogram figure
+                        histogram = plot_histogram(counts)
+                    except:
+                        histogram = None
+                response['histogram'] = histogram
+            
+            return response
+            
         except Exception as e:
             logger.error(f"Error running circuit: {str(e)}")
             return {
@@ -348,6 +474,148 @@ class QuantumPlayground:
                 'error': f'Error running circuit: {str(e)}'
             }
     
+    def run_circuits(self, circuits_data: List[Dict[str, Any]], 
+                     backend_name: str = 'qasm_simulator',
+                     shots: int = 1024) -> Dict[str, Any]:
+        """
+        Run several quantum circuits on the specified backend in one job
+        
+        The circuits are transpiled together and submitted to the backend as
+        a single batch, which Aer executes in parallel.
+        
+        Args:
+            circuits_data: List of serialized circuit data from create_circuit
+            backend_name: Name of the backend to use for simulation/execution
+            shots: Number of shots (repetitions) for each circuit
+            
+        Returns:
+            Dictionary with the counts and histogram data of each circuit, in
+            input order
+        """
+        try:
+            backend, backend_name = self._select_backend(backend_name)
+            
+            transpiled_circuits = self._get_transpiled(circuits_data, backend, backend_name)
+            for i, transpiled_circuit in enumerate(transpiled_circuits):
+                if transpiled_circuit is None:
+                    return {
+                        'success': False,
+                        'error': f'Invalid circuit data at index {i}'
+                    }
+            
+            # Run all circuits as one job; Qiskit results are looked up by
+            # position since a cached circuit can appear more than once
+            result = backend.run(transpiled_circuits, shots=shots).result()
+            if QISKIT_AVAILABLE:
+                all_counts = [result.get_counts(i) for i in range(len(transpiled_circuits))]
+            else:
+                all_counts = [result.get_counts(circuit) for circuit in transpiled_circuits]
+            
+            return {
+                'success': True,
+                'results': [
+                    {'counts': counts, 'histogram_data': self._convert_histogram_to_data(counts)}
+                    for counts in all_counts
+                ],
+                'shots': shots,
+                'backend': backend_name,
+                'quantum_powered': QISKIT_AVAILABLE and self.use_real_quantum,
+            }
+            
+        except Exception as e:
+            logger.error(f"Error running circuits: {str(e)}")
+            return {
+                'success': False,
+                'error': f'Error running circuits: {str(e)}'
+            }
+    
+    def _select_backend(self, backend_name: str) -> tuple:
+        """
+        Resolve a backend name to a backend, defaulting to the local simulator
+        
+        Args:
+            backend_name: Name of the requested backend
+            
+        Returns:
+            Tuple of (backend, name of the backend actually used)
+        """
+        if backend_name.startswith('fake_'):
+            self._load_fake_backends()
+        if backend_name not in self.available_backends:
+            backend_name = 'qasm_simulator'  # Default to local simulator
+            
+        if backend_name == 'qasm_simulator':
+            backend = Aer.get_backend('qasm_simulator')
+        elif backend_name == 'statevector_simulator':
+            backend = Aer.get_backend('statevector_simulator')
+        elif backend_name.startswith('fake_'):
+            backend = self._fake_backends.get(backend_name) or Aer.get_backend('qasm_simulator')
+        elif self.ibmq_provider:
+            try:
+                backend = self.ibmq_provider.get_backend(backend_name)
+            except:
+                backend = Aer.get_backend('qasm_simulator')
+        else:
+            backend = Aer.get_backend('qasm_simulator')
+        
+        return backend, backend_name
+    
+    def _get_transpiled(self, circuits_data: List[Dict[str, Any]], backend, backend_name: str) -> list:
+        """
+        Deserialize, measure and transpile circuits, reusing cached results
+        
+        Circuits missing from the cache are transpiled together in one call.
+        
+        Args:
+            circuits_data: List of serialized circuit data from create_circuit
+            backend: Backend to transpile for
+            backend_name: Name of that backend, part of the cache key
+            
+        Returns:
+            List of transpiled circuits in input order, with None for circuit
+            data that is invalid
+        """
+        cache_keys = [
+            (hashlib.blake2b(_canonical_json(circuit_data)).hexdigest(), backend_name)
+            for circuit_data in circuits_data
+        ]
+        transpiled_circuits = [None] * len(circuits_data)
+        with self._transpile_cache_lock:
+            for i, cache_key in enumerate(cache_keys):
+                cached = self._transpile_cache.get(cache_key)
+                if cached is not None:
+                    self._transpile_cache.move_to_end(cache_key)
+                    transpiled_circuits[i] = cached
+        
+        missing = []
+        circuits = []
+        for i, circuit_data in enumerate(circuits_data):
+            if transpiled_circuits[i] is not None:
+                continue
+            
+            # Deserialize the circuit
+            circuit = self._deserialize_circuit(circuit_data)
+            if not circuit:
+                continue
+            
+            # Ensure the circuit has measurements
+            if not _has_measurement(circuit):
+                circuit.measure_all()
+            missing.append(i)
+            circuits.append(circuit)
+        
+        if circuits:
+            for i, transpiled_circuit in zip(missing, transpile(circuits, backend)):
+                transpiled_circuits[i] = transpiled_circuit
+            
+            with self._transpile_cache_lock:
+                for i in missing:
+                    self._transpile_cache[cache_keys[i]] = transpiled_circuits[i]
+                while len(self._transpile_cache) > TRANSPILE_CACHE_SIZE:
+                    self._transpile_cache.popitem(last=False)
+        
+        return transpiled_circuits
+    
     def get_available_backends(self) -> List[str]:
         """
         Get list of available quantum backends
@@ -355,8 +623,27 @@ class QuantumPlayground:
         Returns:
             List of backend names
         """
+        self._load_fake_backends()
         return self.available_backends
     
+    def _load_fake_backends(self) -> None:
+        """List and keep the FakeProvider backends as fake_<name>, the first time it is called"""
+        if self._fake_backends_loaded:
+            return
+        with self._fake_backends_lock:
+            if self._fake_backends_loaded:
+                return
+            try:
+                fake_provider = FakeProvider()
+                fake_backends = {f"fake_{backend.name()}": backend for backend in fake_provider.backends()}
+                # Swap in new containers so concurrent readers never see partial ones
+                self._fake_backends = fake_backends
+                self.available_backends = self.available_backends + list(fake_backends)
+            except Exception:
+                # Continue without fake backends
+                pass
+            self._fake_backends_loaded = True
+    
     def _create_bell_state_circuit(self, num_qubits: int) -> QuantumCircuit:
         """Create a Bell state circuit"""
         circuit = QuantumCircuit(num_qubits, num_qubits)
@@ -364,10 +651,11 @@ class QuantumPlayground:
         # Apply H to the first qubit
         circuit.h(0)
         
-        # Apply CNOT gates in a chain
-        for i in range(min(2, num_qubits)):
-            if i < num_qubits - 1:
-                circuit.cx(i, i+1)
+        # Apply CNOT gates in a chain over at most the first three qubits
+        if num_qubits > 1:
+            circuit.cx(0, 1)
+        if num_qubits > 2:
+            circuit.cx(1, 2)
         
         return circuit
     
@@ -397,16 +685,16 @@ class QuantumPlayground:
                 # For our simplified version:
                 if QISKIT_AVAILABLE:
                     try:
-                        circuit.cp(np.pi/float(2**(j-i)), i, j)
+                        circuit.cp(_QFT_ANGLES[j-i], i, j)
                     except:
                         # Fallback for older Qiskit versions
                         circuit.cx(i, j)
-                        circuit.rz(np.pi/float(2**(j-i)), j)
+                        circuit.rz(_QFT_ANGLES[j-i], j)
                         circuit.cx(i, j)
                 else:
                     # Fallback for no Qiskit
                     circuit.cx(i, j)
-                    circuit.rz(np.pi/float(2**(j-i)), j)
+                    circuit.rz(_QFT_ANGLES[j-i], j)
                     circuit.cx(i, j)
         
         return circuit
@@ -415,22 +703,29 @@ class QuantumPlayground:
         """Create a random quantum circuit"""
         circuit = QuantumCircuit(num_qubits, num_qubits)
         
-        # List of available single-qubit gates
-        single_qubit_gates = ['h', 'x', 'y', 'z', 'rx', 'ry', 'rz']
-        
         # Apply random gates (simplified approach)
         max_gates = min(20, num_qubits * 5)  # Limit number of gates
         
-        for _ in range(max_gates):
-            gate_type = np.random.choice(['single', 'two'])
-            
-            if gate_type == 'single':
-                qubit = np.random.randint(0, num_qubits)
-                gate = np.random.choice(single_qubit_gates)
+        # Draw all the randomness up front in bulk; the loop only indexes it
+        rng = self._rng
+        is_two = (rng.random(size=max_gates) < 0.5).tolist()  # Fair coin: CNOT or single-qubit gate
+        qubits = rng.integers(0, num_qubits, size=max_gates).tolist()
+        gate_choices = rng.integers(0, len(_SINGLE_QUBIT_GATES), size=max_gates).tolist()
+        thetas = rng.uniform(0, 2*np.pi, size=max_gates).tolist()
+        if num_qubits >= 2:
+            controls = rng.integers(0, num_qubits, size=max_gates)
+            # Offsetting by 1..num_qubits-1 keeps each target off its control
+            targets = ((controls + 1 + rng.integers(0, num_qubits - 1, size=max_gates)) % num_qubits).tolist()
+            controls = controls.tolist()
+        
+        for i in range(max_gates):
+            if not is_two[i]:
+                qubit = qubits[i]
+                gate = _SINGLE_QUBIT_GATES[gate_choices[i]]
                 
                 if gate in ['rx', 'ry', 'rz']:
                     # For rotation gates, apply a random angle
-                    theta = np.random.uniform(0, 2*np.pi)
+                    theta = thetas[i]
                     if gate == 'rx':
                         circuit.rx(theta, qubit)
                     elif gate == 'ry':
@@ -450,13 +745,7 @@ class QuantumPlayground:
             else:
                 # Two-qubit gate (CNOT)
                 if num_qubits >= 2:
-                    control = np.random.randint(0, num_qubits)
-                    target = np.random.randint(0, num_qubits)
-                    # Ensure control and target are different
-                    while target == control:
-                        target = np.random.randint(0, num_qubits)
-                    
-                    circuit.cx(control, target)
+                    circuit.cx(controls[i], targets[i])
         
         # Add a barrier before measurements
         circuit.barrier()
@@ -464,73 +753,71 @@ class QuantumPlayground:
         return circuit
     
     def _serialize_circuit(self, circuit) -> Dict[str, Any]:
-        """Serialize a quantum circuit for storage/transmission"""
-        if QISKIT_AVAILABLE and not isinstance(circuit, FallbackQuantumCircuit):
-            # Extract basic circuit information
-            serialized = {
-                'num_qubits': circuit.num_qubits,
-                'num_clbits': circuit.num_clbits,
-                'gates': []
-            }
+        """
+        Serialize a quantum circuit for storage/transmission
+        
+        Gates are stored column-wise: parallel lists of gate codes (indices
+        into _GATE_NAMES), [qubit, second qubit] pairs, clbits and rotation
+        angles, with -1 or 0.0 for operands a gate doesn't use. A barrier
+        with qubit -1 spans all qubits. Gates without a code are dropped.
+        """
+        codes = []
+        qubits = []
+        clbits = []
+        params = []
+        
+        def add_gate(name, gate_qubits=(), clbit=-1, param=0.0):
+            code = _GATE_CODES.get(name)
+            if code is None:
+                return
+            gate_qubits = list(gate_qubits)
+            if name == 'barrier' and len(gate_qubits) > 2:
+                gate_qubits = []  # Wider barriers are stored as spanning all qubits
+            pair = gate_qubits[:2] + [-1] * (2 - len(gate_qubits[:2]))
+            codes.append(code)
+            qubits.append(pair)
+            clbits.append(clbit)
+            params.append(param)
+        
+        if QISKIT_AVAILABLE:
+            num_clbits = circuit.num_clbits
             
             # Extract gates (simplified)
-            try:
-                for instruction, qargs, cargs in circuit.data:
-                    gate_data = {
-                        'name': instruction.name,
-                        'qubits': [q.index for q in qargs],
-                        'clbits': [c.index for c in cargs] if cargs else []
-                    }
-                    
-                    # Handle parameterized gates
-                    if hasattr(instruction, 'params') and instruction.params:
-                        gate_data['params'] = [float(p) for p in instruction.params]
-                        
-                    serialized['gates'].append(gate_data)
-            except:
-                # Fallback for older Qiskit versions or errors
-                serialized['gates'] = [
-                    {'name': 'h', 'qubits': [0], 'clbits': []},
-                    {'name': 'cx', 'qubits': [0, 1], 'clbits': []}
-                ]
+            for instruction, gate_qubits, gate_clbits in _circuit_instructions(circuit):
+                if instruction.name not in _GATE_CODES:
+                    continue
+                # Handle parameterized gates
+                param = float(instruction.params[0]) if getattr(instruction, 'params', None) else 0.0
+                add_gate(instruction.name,
+                         gate_qubits,
+                         gate_clbits[0] if gate_clbits else -1,
+                         param)
         else:
             # Fallback circuit serialization
-            serialized = {
-                'num_qubits': circuit.num_qubits,
-                'num_clbits': circuit.num_clbits if hasattr(circuit, 'num_clbits') else circuit.num_qubits,
-                'gates': []
-            }
+            num_clbits = circuit.num_clbits if hasattr(circuit, 'num_clbits') else circuit.num_qubits
             
-            # Extract gates from fallback circuit
-            if hasattr(circuit, 'gates'):
-                for gate in circuit.gates:
-                    gate_data = {'name': gate[0]}
-                    
-                    if gate[0] == 'measure_all':
-                        gate_data['qubits'] = list(range(circuit.num_qubits))
-                        gate_data['clbits'] = list(range(circuit.num_clbits))
-                    elif gate[0] in ['rx', 'ry', 'rz']:
-                        # Rotation gates have a parameter
-                        gate_data['params'] = [float(gate[1])]
-                        gate_data['qubits'] = [gate[2]]
-                        gate_data['clbits'] = []
-                    elif gate[0] == 'barrier':
-                        gate_data['qubits'] = gate[1] if len(gate) > 1 else list(range(circuit.num_qubits))
-                        gate_data['clbits'] = []
-                    elif gate[0] == 'measure':
-                        gate_data['qubits'] = [gate[1]]
-                        gate_data['clbits'] = [gate[2]]
-                    elif gate[0] == 'cx':
-                        gate_data['qubits'] = [gate[1], gate[2]]
-                        gate_data['clbits'] = []
+            # Extract gates from fallback circuit; its columns already use
+            # the serialized operand layout
+            for name, qa, qb, param in circuit.gate_rows():
+                code = _GATE_CODES.get(name)
+                if code is not None:
+                    codes.append(code)
+                    if name == 'measure':
+                        qubits.append([qa, -1])
+                        clbits.append(qb)
                     else:
-                        # Single-qubit gates without parameters
-                        gate_data['qubits'] = [gate[1]]
-                        gate_data['clbits'] = []
-                        
-                    serialized['gates'].append(gate_data)
+                        qubits.append([qa, qb])
+                        clbits.append(-1)
+                    params.append(param)
         
-        return serialized
+        return {
+            'num_qubits': circuit.num_qubits,
+            'num_clbits': num_clbits,
+            'codes': codes,
+            'qubits': qubits,
+            'clbits': clbits,
+            'params': params
+        }
     
     def _deserialize_circuit(self, circuit_data: Dict[str, Any]) -> QuantumCircuit:
         """Deserialize a quantum circuit from a dictionary"""
@@ -540,43 +827,21 @@ class QuantumPlayground:
             
             circuit = QuantumCircuit(num_qubits, num_clbits)
             
-            # Add gates
-            for gate_data in circuit_data.get('gates', []):
-                gate_name = gate_data.get('name', '')
-                qubits = gate_data.get('qubits', [])
-                clbits = gate_data.get('clbits', [])
-                params = gate_data.get('params', [])
-                
-                if gate_name == 'h':
-                    for q in qubits:
-                        circuit.h(q)
-                elif gate_name == 'x':
-                    for q in qubits:
-                        circuit.x(q)
-                elif gate_name == 'y':
-                    for q in qubits:
-                        circuit.y(q)
-                elif gate_name == 'z':
-                    for q in qubits:
-                        circuit.z(q)
-                elif gate_name == 'cx' and len(qubits) >= 2:
-                    circuit.cx(qubits[0], qubits[1])
-                elif gate_name == 'rx' and params and qubits:
-                    circuit.rx(params[0], qubits[0])
-                elif gate_name == 'ry' and params and qubits:
-                    circuit.ry(params[0], qubits[0])
-                elif gate_name == 'rz' and params and qubits:
-                    circuit.rz(params[0], qubits[0])
-                elif gate_name == 'barrier':
-                    if qubits:
-                        circuit.barrier(*qubits)
-                    else:
-                        circuit.barrier()
-                elif gate_name == 'measure':
-                    if len(qubits) > 0 and len(clbits) > 0:
-                        circuit.measure(qubits[0], clbits[0])
-                elif gate_name == 'measure_all':
-                    circuit.measure_all()
+            # Add gates; circuits serialized before the column layout carry a
+            # list of gate dictionaries instead
+            if 'gates' in circuit_data:
+                rows = _legacy_gate_rows(circuit_data['gates'])
+            else:
+                rows = zip(circuit_data.get('codes', []), circuit_data.get('qubits', []),
+                           circuit_data.get('clbits', []), circuit_data.get('params', []))
+            
+            if QISKIT_AVAILABLE:
+                self._replay_fused(circuit, rows)
+            else:
+                dispatch = self._GATE_DISPATCH
+                for code, (q0, q1), clbit, param in rows:
+                    if 0 <= code < len(dispatch):  # Unknown gates are skipped
+                        dispatch[code](circuit, q0, q1, clbit, param)
             
             return circuit
             
@@ -584,48 +849,198 @@ class QuantumPlayground:
             logger.error(f"Error deserializing circuit: {str(e)}")
             return None
 
+    def _replay_fused(self, circuit, rows) -> None:
+        """
+        Replay gate rows onto a Qiskit circuit, fusing single-qubit gate runs
+        
+        Consecutive single-qubit gates on a qubit are multiplied into one 2x2
+        matrix and appended as a single unitary gate, like Aer's gate fusion
+        pass; a run of one gate is appended as that gate. A run ends when a
+        CNOT, barrier or measurement touches its qubit.
+        
+        Args:
+            circuit: Qiskit circuit to append to
+            rows: (code, [qubit, second qubit], clbit, param) gate rows
+        """
+        dispatch = self._GATE_DISPATCH
+        pending = {}  # Qubit -> [fused matrix, first gate row, gate count]
+        
+        def flush(qubit):
+            run = pending.pop(qubit, None)
+            if run is None:
+                return
+            matrix, first, count = run
+            if count == 1:
+                dispatch[first[0]](circuit, *first[1:])
+            else:
+                circuit.unitary(matrix, [qubit])
+        
+        for code, (q0, q1), clbit, param in rows:
+            if not 0 <= code < len(dispatch):
+                continue  # Unknown gates are skipped
+            if code in _SINGLE_QUBIT_MATRICES:
+                gate = _SINGLE_QUBIT_MATRICES[code](param)
+                run = pending.get(q0)
+                if run is None:
+                    pending[q0] = [gate, (code, q0, q1, clbit, param), 1]
+                else:
+                    run[0] = gate @ run[0]
+                    run[2] += 1
+                continue
+            
+            # Gates spanning all qubits end every run, others only their own
+            if q0 < 0:
+                for qubit in list(pending):
+                    flush(qubit)
+            else:
+                flush(q0)
+                if q1 >= 0:
+                    flush(q1)
+            dispatch[code](circuit, q0, q1, clbit, param)
+        
+        for qubit in list(pending):
+            flush(qubit)
+    
     def _convert_histogram_to_data(self, counts: Dict[str, int]) -> Dict[str, Any]:
         """Convert histogram counts to visualization data"""
         # Sort by bitstring
-        sorted_counts = dict(sorted(counts.items()))
-        
-        # Calculate probabilities
-        total_shots = sum(sorted_counts.values())
-        probabilities = {k: v / total_shots for k, v in sorted_counts.items()}
+        labels = list(counts)
+        order = _bitstring_order(labels)
+        labels = [labels[i] for i in order]
+        values = np.fromiter(counts.values(), dtype=np.int64, count=len(counts))[order]
         
-        # Format for visualization
-        labels = list(sorted_counts.keys())
-        values = list(sorted_counts.values())
-        probs = list(probabilities.values())
+        # Calculate probabilities in one vectorized division; all-zero counts
+        # (e.g. fewer shots than fallback bitstrings) get zero probabilities
+        total = values.sum()
+        probs = values / total if total else np.zeros(len(values))
         
         return {
             'labels': labels,
-            'values': values,
-            'probabilities': probs
+            'values': values.tolist(),
+            'probabilities': probs.tolist()
         }
 
 
 # Example usage functions
 
+@lru_cache(maxsize=1)
+def _default_playground() -> QuantumPlayground:
+    """Return the local-simulation playground shared by the demo functions"""
+    return QuantumPlayground()
+
 def create_demo_bell_state():
     """Create a demonstration Bell state circuit"""
-    playground = QuantumPlayground()
+    playground = _default_playground()
     return playground.create_circuit(2, 'bell')
 
 def create_demo_ghz_state():
     """Create a demonstration GHZ state circuit"""
-    playground = QuantumPlayground()
+    playground = _default_playground()
     return playground.create_circuit(3, 'ghz')
 
 def create_demo_qft():
     """Create a demonstration QFT circuit"""
-    playground = QuantumPlayground()
+    playground = _default_playground()
     return playground.create_circuit(4, 'qft')
 
 def run_demo_circuit():
     """Run a demonstration circuit and get results"""
-    playground = QuantumPlayground()
+    playground = _default_playground()
     circuit_data = playground.create_circuit(2, 'bell')
     if circuit_data.get('success', False):
         return playground.run_circuit(circuit_data['circuit'])
-    return {'success': False, 'error': 'Failed to create circuit'}
\ No newline at end of file
+    return {'success': False, 'error': 'Failed to create circuit'}
+
+def _has_measurement(circuit) -> bool:
+    """
+    Check whether a circuit already measures its qubits
+    
+    Args:
+        circuit: Qiskit or fallback circuit
+        
+    Returns:
+        True if a fallback circuit has a measure_all gate, or a Qiskit
+        circuit has any measure instruction
+    """
+    if not QISKIT_AVAILABLE:
+        return 'measure_all' in circuit.gate_names
+    return 'measure' in circuit.count_ops()
+
+def _legacy_gate_rows(gates: List[Dict[str, Any]]):
+    """
+    Convert gate dictionaries of the older serialized format to gate rows
+    
+    Args:
+        gates: List of {'name', 'qubits', 'clbits', 'params'} dictionaries
+        
+    Yields:
+        (code, [qubit, second qubit], clbit, param) tuples as stored by
+        _serialize_circuit; gates missing the operands they need and unknown
+        gates are skipped
+    """
+    for gate_data in gates:
+        gate_name = gate_data.get('name', '')
+        qubits = gate_data.get('qubits', [])
+        clbits = gate_data.get('clbits', [])
+        params = gate_data.get('params', [])
+        code = _GATE_CODES.get(gate_name)
+        
+        if gate_name in ('h', 'x', 'y', 'z'):
+            for q in qubits:
+                yield code, (q, -1), -1, 0.0
+        elif gate_name == 'cx' and len(qubits) >= 2:
+            yield code, (qubits[0], qubits[1]), -1, 0.0
+        elif gate_name in ('rx', 'ry', 'rz') and params and qubits:
+            yield code, (qubits[0], -1), -1, params[0]
+        elif gate_name == 'barrier':
+            if 0 < len(qubits) <= 2:
+                yield code, (qubits[0], qubits[1] if len(qubits) > 1 else -1), -1, 0.0
+            else:
+                yield code, (-1, -1), -1, 0.0
+        elif gate_name == 'measure' and qubits and clbits:
+            yield code, (qubits[0], -1), clbits[0], 0.0
+        elif gate_name == 'measure_all':
+            yield code, (-1, -1), -1, 0.0
+
+
+def _canonical_json(obj) -> bytes:
+    """Encode obj as JSON with sorted keys, for use in cache keys"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, sort_keys=True).encode()
+
+# Largest ratio of the dense 2**width table to the number of labels at which
+# _bitstring_order scatters instead of sorting
+_DENSE_ORDER_FACTOR = 4
+
+def _bitstring_order(labels: List[str]) -> np.ndarray:
+    """
+    Indices that sort count labels in ascending order
+    
+    Equal-width bitstrings are ordered by scattering their integer values
+    into a dense 2**width table, a linear pass instead of a string sort,
+    when that table is at most _DENSE_ORDER_FACTOR times the number of
+    labels. Other labels, such as Qiskit's space-separated registers, are
+    sorted as strings.
+    
+    Args:
+        labels: Keys of a counts dictionary
+        
+    Returns:
+        Integer index array into labels
+    """
+    width = len(labels[0]) if labels else 0
+    if (0 < width < 63 and (1 << width) <= _DENSE_ORDER_FACTOR * len(labels)
+            and all(len(label) == width for label in labels)):
+        # Only labels made of '0' and '1' characters sort like their values
+        chars = np.frombuffer(''.join(labels).encode('ascii', 'replace'), dtype=np.uint8)
+        if ((chars == ord('0')) | (chars == ord('1'))).all():
+            bits = chars.reshape(len(labels), width) - ord('0')
+            indices = bits.astype(np.int64) @ (1 << np.arange(width - 1, -1, -1, dtype=np.int64))
+            positions = np.full(1 << width, -1, dtype=np.int64)
+            positions[indices] = np.arange(len(labels))
+            order = positions[positions >= 0]
+            # Repeated labels share a slot; sort those as strings instead
+            if len(order) == len(labels):
+                return order
+    return np.array(sorted(range(len(labels)), key=labels.__getitem__), dtype=np.int64)